@@ -1,9 +1,10 @@
 import numpy as np
-import pandas as pd
-import itertools
-import random
 import matplotlib.pyplot as plt
 
+from rookiesophomore.optimize import top_rosters
+from rookiesophomore.simulation import RosterRequirements
+from rookiesophomore.tables import PlayerTable
+
 # Sample player pool with mean and std dev for weekly points
 player_pool = [
     {"name": "QB1", "position": "QB", "mean": 20, "std": 5},
@@ -32,30 +33,22 @@ limits = {
 # Simulation parameters
 weeks = 14
 simulations = 1000
+candidates = 20  # best rosters by expected points to simulate
 
-# Filter players by position
-def filter_players(position):
-    return [p for p in player_pool if p["position"] == position]
-
-# Generate valid roster combinations
+# Find the best roster combinations by expected points
 def generate_rosters():
-    qbs = filter_players("QB")
-    rbs = filter_players("RB")
-    wrs = filter_players("WR")
-    tes = filter_players("TE")
-    flex_pool = [p for p in player_pool if p["position"] in ["RB", "WR"]]
-
-    rosters = []
-    for qb in itertools.combinations(qbs, limits["QB"]):
-        for rb in itertools.combinations(rbs, limits["RB"]):
-            for wr in itertools.combinations(wrs, limits["WR"]):
-                for te in itertools.combinations(tes, limits["TE"]):
-                    for flex in itertools.combinations(flex_pool, limits["FLEX"]):
-                        roster = list(qb + rb + wr + te + flex)
-                        # Ensure no duplicate players
-                        if len(set(p["name"] for p in roster)) == sum(limits.values()):
-                            rosters.append(roster)
-    return rosters
+    players = PlayerTable(
+        [p["name"] for p in player_pool],
+        [p["position"] for p in player_pool],
+        [p["mean"] for p in player_pool],
+        [p["std"] for p in player_pool]
+    )
+    requirements = RosterRequirements(
+        QB=limits["QB"], RB=limits["RB"], WR=limits["WR"], TE=limits["TE"],
+        FLEX=limits["FLEX"], flex_positions=["RB", "WR"]
+    )
+    batch = top_rosters(players, requirements, k=candidates)
+    return [[player_pool[i] for i in row] for row in batch.index]
 
 # Simulate a season for a given roster
 def simulate_season(roster):
@@ -82,14 +75,14 @@ for roster in rosters:
     })
 
 # Display top 5 rosters by average score
-top_rosters = sorted(results, key=lambda x: x["average_score"], reverse=True)[:5]
-for i, r in enumerate(top_rosters, 1):
+best = sorted(results, key=lambda x: x["average_score"], reverse=True)[:5]
+for i, r in enumerate(best, 1):
     print(f"Roster {i}: {r['roster']}")
     print(f"Average Season Score: {r['average_score']:.2f}")
     print()
 
 # Plot distribution for top roster
-plt.hist(top_rosters[0]["score_distribution"], bins=30, alpha=0.7)
+plt.hist(best[0]["score_distribution"], bins=30, alpha=0.7)
 plt.title("Score Distribution for Top Roster")
 plt.xlabel("Season Points")
 plt.ylabel("Frequency")
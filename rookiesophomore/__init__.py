@@ -1,2 +1,44 @@
-from .ranking import *
-from .simulation import *
+import importlib
+
+# Public names by submodule; submodules are imported on first attribute access so
+# `import rookiesophomore` and the CLI do not pay for pandas or matplotlib up front
+_SUBMODULE_EXPORTS = {
+    "ranking": (
+        "POSITION_LIMITS", "BENCH_SIZE", "RISK_AVERSION", "load_data", "filter_eligible_players",
+        "calculate_risk_adjusted_score", "select_starters", "select_bench", "assign_tiers", "tier_numbers",
+        "descending_ranks", "select_roster_grid", "rank_grid", "build_roster_grid", "build_roster_batch",
+        "build_roster", "rank_players"
+    ),
+    "simulation": ("ROSTER_PRESETS", "RosterRequirements", "RosterSimulator"),
+    "tables": ("PLAYER_DTYPES", "REQUIRED_COLUMNS", "Player", "PlayerTable", "load_player_pool", "RosterBatch",
+               "is_frame"),
+    "sampling": ("sample_rosters",),
+    "optimize": ("top_rosters",),
+    "cache": ("CACHE_DIR", "MAX_BYTES", "cache_key", "ResultCache", "pack_results", "unpack_results",
+              "pack_frame", "unpack_frame"),
+    "correlation": ("CorrelationModel", "CorrelationFactor"),
+    "lineup": ("POSITION_SPACING", "best_lineup_points"),
+    "draft": ("WINDOW", "ADP_RISK_AVERSION", "snake_order", "MockDraftResult", "DraftSimulator"),
+    "league": ("round_robin_schedule", "LeagueResult", "LeagueSimulator"),
+    "session": ("SimulationSession",),
+    "results": ("FORMAT_VERSION", "SUMMARY_COLUMNS", "write_results", "ResultsFile"),
+    "archive": ("ARCHIVE_COLUMNS", "GROUP_COLUMNS", "CHUNK_SIZE", "FLEX_POSITIONS", "candidate_depth",
+                "top_candidates", "stream_file", "rank_group", "rank_archive"),
+    "profiling": ("PROFILE_FORMATS", "Profiler", "NULL_PROFILER")
+}
+_EXPORTS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,110 @@
+"""
+Streaming ranking over multi-season, multi-file projection archives.
+"""
+import os
+from functools import partial
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from .parallel import get_pool
+from .ranking import BENCH_SIZE, POSITION_LIMITS, RISK_AVERSION, rank_players
+
+ARCHIVE_COLUMNS = ['name', 'position', 'experience', 'mean_projection', 'floor_projection', 'ceiling_projection']
+GROUP_COLUMNS = ('season', 'source')
+CHUNK_SIZE = 100_000
+FLEX_POSITIONS = ['QB', 'RB', 'WR', 'TE']
+
+def candidate_depth(position_limits: dict, bench_size: int) -> dict:
+    """
+    Players per position a group must keep so select_starters/select_bench see the same roster.
+
+    Starters at a position come from its top limit, superflex picks from the next
+    SUPERFLEX, and bench picks from the next bench_size, so deeper players never
+    make the roster. Positions without a starting limit only fill the bench.
+    """
+    superflex = position_limits.get('SUPERFLEX', 0)
+    depth = {pos: position_limits.get(pos, 0) + superflex + bench_size for pos in FLEX_POSITIONS}
+    depth['*'] = bench_size
+    return depth
+
+def top_candidates(df: pd.DataFrame, group_by: List[str], depth: dict) -> pd.DataFrame:
+    """Keep each group's best players per position by risk-adjusted score."""
+    df = df.sort_values(by='risk_adjusted_score', ascending=False, kind='stable')
+    limit = df['position'].map(depth).fillna(depth['*']).to_numpy()
+    rank = df.groupby(group_by + ['position'], sort=False, dropna=False).cumcount().to_numpy()
+    return df[rank < limit]
+
+def stream_file(filepath: str,
+                group_by: Sequence[str] = GROUP_COLUMNS,
+                position_limits: dict = POSITION_LIMITS,
+                bench_size: int = BENCH_SIZE,
+                lambda_risk: float = RISK_AVERSION,
+                columns: Sequence[str] = (),
+                chunksize: int = CHUNK_SIZE) -> pd.DataFrame:
+    """
+    Read one archive file in chunks and keep only each group's roster candidates.
+
+    Only the ranking, grouping and requested extra columns are parsed; group
+    columns missing from the file are filled with the file name. Memory stays at
+    one chunk plus the candidates, however large the file.
+    """
+    group_by = list(group_by)
+    header = pd.read_csv(filepath, nrows=0).columns
+    wanted = set(ARCHIVE_COLUMNS) | set(group_by) | set(columns)
+    usecols = [column for column in header if column in wanted]
+    depth = candidate_depth(position_limits, bench_size)
+    source = os.path.splitext(os.path.basename(filepath))[0]
+    kept = None
+    for chunk in pd.read_csv(filepath, usecols=usecols, chunksize=chunksize):
+        # Filter before any other work: most archive rows are veterans
+        chunk = chunk[chunk['experience'].isin(['rookie', 'sophomore'])]
+        for column in group_by:
+            if column not in chunk:
+                chunk = chunk.assign(**{column: source})
+        std_dev = (chunk['ceiling_projection'] - chunk['floor_projection']) / 4
+        chunk = chunk.assign(risk_adjusted_score=chunk['mean_projection'] - lambda_risk * std_dev)
+        merged = chunk if kept is None else pd.concat([kept, chunk])
+        kept = top_candidates(merged, group_by, depth)
+    if kept is None:
+        return pd.DataFrame(columns=usecols + ['risk_adjusted_score'])
+    return kept
+
+def rank_group(group: pd.DataFrame,
+               position_limits: dict = POSITION_LIMITS,
+               bench_size: int = BENCH_SIZE,
+               lambda_risk: float = RISK_AVERSION) -> pd.DataFrame:
+    """build_roster's ranking for one group's candidates."""
+    group = group.drop(columns='risk_adjusted_score').reset_index(drop=True)
+    return rank_players(group, position_limits, bench_size, lambda_risk)
+
+def rank_archive(filepaths: Sequence[str],
+                 group_by: Sequence[str] = GROUP_COLUMNS,
+                 position_limits: dict = POSITION_LIMITS,
+                 bench_size: int = BENCH_SIZE,
+                 lambda_risk: float = RISK_AVERSION,
+                 columns: Sequence[str] = (),
+                 chunksize: int = CHUNK_SIZE,
+                 processes: Optional[int] = None) -> pd.DataFrame:
+    """
+    Roster and tier output of build_roster for every season/source group in an archive.
+
+    Files are streamed in chunks, keeping per group and position only the top
+    candidates that can still make the roster, then each group is ranked on its
+    candidates. With processes set, files and then groups are spread over the
+    persistent worker pool.
+    """
+    group_by = list(group_by)
+    read = partial(stream_file, group_by=group_by, position_limits=position_limits, bench_size=bench_size,
+                   lambda_risk=lambda_risk, columns=columns, chunksize=chunksize)
+    pool = get_pool(processes) if processes else None
+    candidates = pool.map(read, filepaths) if pool else [read(filepath) for filepath in filepaths]
+    # Groups can span files; reduce once more across them
+    merged = top_candidates(pd.concat(candidates, ignore_index=True),
+                            group_by, candidate_depth(position_limits, bench_size))
+    groups = [group for _, group in merged.groupby(group_by, sort=True, dropna=False)]
+    rank = partial(rank_group, position_limits=position_limits, bench_size=bench_size, lambda_risk=lambda_risk)
+    rosters = pool.map(rank, groups) if pool else [rank(group) for group in groups]
+    if not rosters:
+        return pd.DataFrame()
+    return pd.concat(rosters, ignore_index=True)
@@ -0,0 +1,368 @@
+"""
+Benchmarks for the roster generation, simulation and ranking hot paths.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from .parallel import CHUNK_SIZE
+from .ranking import build_roster
+from .simulation import ROSTER_PRESETS, RosterRequirements, RosterSimulator
+
+CASES = (
+    "generate_rosters",
+    "simulate_season",
+    "run_simulation_single",
+    "run_simulation_multiprocessing",
+    "build_roster",
+    "import_package",
+    "cli_help"
+)
+# Share of players at each position in synthetic pools
+POSITION_SHARES = {"QB": 0.15, "RB": 0.3, "WR": 0.35, "TE": 0.2}
+THRESHOLD = 0.2
+# Fresh-interpreter commands for the startup cases; startup must stay within
+# STARTUP_BUDGET seconds and must not import HEAVY_MODULES
+STARTUP_COMMANDS = {
+    "import_package": ["-c", "import rookiesophomore"],
+    "cli_help": ["-m", "rookiesophomore.cli", "--help"]
+}
+STARTUP_BUDGET = 0.2
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib")
+# Report params that change the measured work; a baseline must match them to be comparable
+WORKLOAD_PARAMS = ("pool_size", "roster_type", "weeks", "simulations", "n_rosters", "seed")
+
+
+def synthetic_pool(n_players, seed=0):
+    """
+    Random player pool with realistic position mix and projections.
+
+    Args:
+        n_players (int): Number of players.
+        seed (int): Seed for the generator.
+
+    Returns:
+        pd.DataFrame: name, team, position and proj_floor/mean/ceiling/sd columns.
+    """
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(list(POSITION_SHARES), size=n_players, p=list(POSITION_SHARES.values()))
+    mean = rng.gamma(4.0, 3.0, size=n_players)
+    sd = mean * rng.uniform(0.2, 0.5, size=n_players)
+    return pd.DataFrame({
+        "name": [f"Player{i}" for i in range(n_players)],
+        "team": [f"Team{t}" for t in rng.integers(0, 32, size=n_players)],
+        "position": positions,
+        "proj_floor": np.maximum(mean - 1.5 * sd, 0),
+        "proj_mean": mean,
+        "proj_ceiling": mean + 1.5 * sd,
+        "proj_sd": sd
+    })
+
+
+def synthetic_rankings(n_players, seed=0):
+    """
+    Random ranking input in the layout build_roster reads.
+
+    Args:
+        n_players (int): Number of rows.
+        seed (int): Seed for the generator.
+
+    Returns:
+        pd.DataFrame: name, position, experience and mean/floor/ceiling projections.
+    """
+    rng = np.random.default_rng(seed)
+    pool = synthetic_pool(n_players, seed)
+    return pd.DataFrame({
+        "name": pool["name"],
+        "position": pool["position"],
+        "experience": rng.choice(["rookie", "sophomore", "veteran"], size=n_players, p=[0.2, 0.2, 0.6]),
+        "mean_projection": pool["proj_mean"] * 17,
+        "floor_projection": pool["proj_floor"] * 17,
+        "ceiling_projection": pool["proj_ceiling"] * 17
+    })
+
+
+def preset_requirements(roster_type):
+    """
+    RosterRequirements for a ROSTER_PRESETS entry.
+
+    Args:
+        roster_type (str): Preset name.
+
+    Returns:
+        RosterRequirements: Requirements with unlisted slots set to zero.
+    """
+    if roster_type not in ROSTER_PRESETS:
+        raise ValueError(f"Unknown roster type {roster_type!r}; expected one of {', '.join(ROSTER_PRESETS)}")
+    preset = ROSTER_PRESETS[roster_type]
+    return RosterRequirements(**{slot: preset.get(slot, 0) for slot in ("QB", "RB", "WR", "TE", "FLEX", "SUPERFLEX")})
+
+
+def measure(fn, repeat=3):
+    """
+    Best wall time over several runs, then peak traced memory of one more run.
+
+    Args:
+        fn (Callable[[], object]): Work to measure.
+        repeat (int): Timed runs.
+
+    Returns:
+        Tuple[float, float]: Seconds of the fastest run and peak memory in MiB.
+            Memory allocated in worker processes is not traced.
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak / 1024 ** 2
+
+
+def run_python(args, importtime=False):
+    """
+    Run a fresh interpreter that can import this package.
+
+    Args:
+        args (List[str]): Interpreter arguments, e.g. ["-c", "import rookiesophomore"].
+        importtime (bool): Run with -X importtime.
+
+    Returns:
+        subprocess.CompletedProcess: Finished process with captured output.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + list(args)
+    return subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+
+
+def startup_modules(args):
+    """
+    Top-level modules a fresh interpreter imports while running a command.
+
+    Args:
+        args (List[str]): Interpreter arguments.
+
+    Returns:
+        Set[str]: Top-level package names from the -X importtime log.
+    """
+    stderr = run_python(args, importtime=True).stderr
+    return {
+        line.rsplit("|", 1)[1].strip().split(".")[0]
+        for line in stderr.splitlines() if line.startswith("import time:") and line.count("|") == 2
+    }
+
+
+def check_startup(report, budget=STARTUP_BUDGET):
+    """
+    Startup cases that are over budget or import heavy dependencies.
+
+    Args:
+        report (dict): run_benchmarks output.
+        budget (float): Allowed seconds per startup case, interpreter start included.
+
+    Returns:
+        List[str]: One message per problem.
+    """
+    problems = []
+    for case, args in STARTUP_COMMANDS.items():
+        result = report["cases"].get(case)
+        if result is None:
+            continue
+        if result["seconds"] > budget:
+            problems.append(f"{case} took {result['seconds']:.3f}s, over the {budget:.3f}s budget")
+        heavy = sorted(startup_modules(args) & set(HEAVY_MODULES))
+        if heavy:
+            problems.append(f"{case} imports {', '.join(heavy)}")
+    return problems
+
+
+def run_benchmarks(pool_size=500, roster_type="standard", weeks=14, simulations=1000,
+                   n_rosters=1000, repeat=3, cases=None, seed=0):
+    """
+    Run benchmark cases on synthetic data.
+
+    Args:
+        pool_size (int): Players in the synthetic pool (and rows of the ranking input).
+        roster_type (str): ROSTER_PRESETS entry for the roster shape.
+        weeks (int): Weeks per season.
+        simulations (int): Simulations per roster.
+        n_rosters (int): Rosters generated and simulated.
+        repeat (int): Timed runs per case; the fastest is reported.
+        cases (Sequence[str], optional): Subset of CASES to run.
+        seed (int): Seed for data generation and simulation.
+
+    Returns:
+        dict: "params" with the settings and environment, and "cases" mapping each
+        case to its seconds, peak_mb and, for simulation cases, draws_per_second.
+        Startup cases time a fresh interpreter, so their peak_mb is near zero.
+        run_simulation_multiprocessing simulates at least two chunks of rosters so
+        it reaches the worker pool; params["multiprocessing_rosters"] records how many.
+    """
+    cases = list(cases or CASES)
+    unknown = sorted(set(cases) - set(CASES))
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {', '.join(unknown)}")
+    pool = synthetic_pool(pool_size, seed)
+    requirements = preset_requirements(roster_type)
+
+    def simulator():
+        return RosterSimulator(pool, requirements, weeks=weeks, simulations=simulations, seed=seed)
+
+    rosters = simulator().generate_rosters(n_rosters)
+    draws = len(rosters) * rosters.roster_size * weeks * simulations
+    # A single chunk would run in-process, so the multiprocessing case gets at least two
+    mp_rosters = max(n_rosters, 2 * CHUNK_SIZE)
+    mp_draws = draws
+    if mp_rosters != n_rosters:
+        mp_batch = simulator().generate_rosters(mp_rosters)
+        mp_draws = len(mp_batch) * mp_batch.roster_size * weeks * simulations
+    work = {
+        "generate_rosters": (lambda: simulator().generate_rosters(n_rosters), None),
+        "simulate_season": (lambda: simulator().simulate_season(rosters), draws),
+        "run_simulation_single": (lambda: simulator().run_simulation(n_rosters, use_multiprocessing=False), draws),
+        "run_simulation_multiprocessing": (lambda: simulator().run_simulation(mp_rosters, use_multiprocessing=True),
+                                           mp_draws)
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        rankings = os.path.join(directory, "rankings.csv")
+        if "build_roster" in cases:
+            synthetic_rankings(pool_size, seed).to_csv(rankings, index=False)
+        work["build_roster"] = (lambda: build_roster(rankings), None)
+        for case, args in STARTUP_COMMANDS.items():
+            work[case] = (lambda args=args: run_python(args), None)
+
+        results = {}
+        for case in cases:
+            fn, case_draws = work[case]
+            seconds, peak_mb = measure(fn, repeat)
+            results[case] = {"seconds": seconds, "peak_mb": peak_mb}
+            if case_draws:
+                results[case]["draws_per_second"] = case_draws / seconds
+    return {
+        "params": {
+            "pool_size": pool_size,
+            "roster_type": roster_type,
+            "weeks": weeks,
+            "simulations": simulations,
+            "n_rosters": n_rosters,
+            "multiprocessing_rosters": mp_rosters,
+            "repeat": repeat,
+            "seed": seed,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "cpu_count": os.cpu_count()
+        },
+        "cases": results
+    }
+
+
+def save_baseline(report, path):
+    """
+    Write a benchmark report as JSON.
+
+    Args:
+        report (dict): Output of run_benchmarks.
+        path (str): Destination file.
+    """
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_baseline(path):
+    """
+    Read a benchmark report written by save_baseline.
+
+    Args:
+        path (str): Baseline file.
+
+    Returns:
+        dict: Benchmark report.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def mismatched_params(params, baseline):
+    """
+    Workload params that differ from a baseline's.
+
+    Environment params (Python and numpy versions, CPU count) and repeat may
+    differ; comparing across them is what a baseline is for.
+
+    Args:
+        params (dict): Current report params.
+        baseline (dict): Baseline report.
+
+    Returns:
+        List[str]: One "name: baseline -> current" message per mismatch.
+    """
+    before = baseline.get("params", {})
+    return [
+        f"{name}: {before.get(name)!r} -> {params.get(name)!r}"
+        for name in WORKLOAD_PARAMS if before.get(name) != params.get(name)
+    ]
+
+
+def compare(report, baseline, threshold=THRESHOLD):
+    """
+    Cases that got slower than a baseline by more than a threshold.
+
+    Args:
+        report (dict): Current run_benchmarks output.
+        baseline (dict): Baseline report.
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        List[dict]: case, baseline and current seconds, and ratio for each regression.
+
+    Raises:
+        ValueError: If the baseline was run with different workload params.
+    """
+    mismatched = mismatched_params(report["params"], baseline)
+    if mismatched:
+        raise ValueError(f"Baseline params differ: {'; '.join(mismatched)}")
+    regressions = []
+    for case, current in report["cases"].items():
+        before = baseline["cases"].get(case)
+        if before is None:
+            continue
+        ratio = current["seconds"] / before["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append({"case": case, "baseline": before["seconds"], "current": current["seconds"], "ratio": ratio})
+    return regressions
+
+
+def format_report(report, baseline=None):
+    """
+    Human-readable table of a benchmark report.
+
+    Args:
+        report (dict): run_benchmarks output.
+        baseline (dict, optional): Baseline to show relative changes against.
+
+    Returns:
+        str: One line per case.
+    """
+    lines = [f"{'case':<32}{'seconds':>10}{'peak MiB':>10}{'draws/s':>14}{'vs base':>10}"]
+    for case, result in report["cases"].items():
+        rate = result.get("draws_per_second")
+        line = f"{case:<32}{result['seconds']:>10.4f}{result['peak_mb']:>10.1f}{(f'{rate:,.0f}' if rate else '-'):>14}"
+        before = (baseline or {}).get("cases", {}).get(case)
+        if before:
+            line += f"{result['seconds'] / before['seconds'] - 1:>+10.1%}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,248 @@
+"""
+On-disk, content-addressed cache for simulation and ranking results.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+CACHE_DIR = os.environ.get("ROOKIESOPHOMORE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "rookiesophomore"))
+MAX_BYTES = 512 * 1024 ** 2
+
+
+def cache_key(*parts):
+    """
+    Hash arrays and parameters into a cache key.
+
+    Arrays are hashed by dtype, shape and contents; object arrays by their string
+    values. Everything else must be JSON serializable; dict keys are sorted.
+
+    Args:
+        *parts: Arrays, scalars, strings, lists or dicts.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            array = part.astype(str) if part.dtype == object else np.ascontiguousarray(part)
+            digest.update(f"{array.dtype.str}{array.shape}".encode())
+            digest.update(array.tobytes())
+        elif isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=repr).encode())
+        # Separator so adjacent parts cannot run together
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of .npz payloads keyed by content hash, evicted least recently used first.
+
+    Args:
+        directory (str, optional): Cache directory. Defaults to CACHE_DIR, which
+            honours the ROOKIESOPHOMORE_CACHE_DIR environment variable.
+        max_bytes (int): Total payload size kept on disk.
+    """
+    def __init__(self, directory=None, max_bytes=MAX_BYTES):
+        self.directory = directory or CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _entries(self):
+        """
+        Cached payloads, least recently used first.
+
+        Returns:
+            List[Tuple[str, int]]: (path, size in bytes) per entry.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, os.path.join(self.directory, name), stat.st_size))
+        return [(path, size) for _, path, size in sorted(entries)]
+
+    def get(self, key):
+        """
+        Load a cached payload and mark it as recently used.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            dict or None: Arrays of the payload, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, unreadable or evicted by another process since loading
+            return None
+        return arrays
+
+    def put(self, key, arrays):
+        """
+        Store a payload, then evict old entries beyond max_bytes.
+
+        Args:
+            key (str): Cache key.
+            arrays (dict): Arrays to store; object arrays are not allowed.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial payload
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            # Temporary files are invisible to _entries and evict; never leave one behind
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        entries = self._entries()
+        total = sum(size for _, size in entries)
+        removed = 0
+        for path, size in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def stats(self):
+        """
+        Summary of the cache contents.
+
+        Returns:
+            dict: Directory, number of entries, total bytes and the size limit.
+        """
+        entries = self._entries()
+        return {
+            "directory": self.directory,
+            "entries": len(entries),
+            "bytes": sum(size for _, size in entries),
+            "max_bytes": self.max_bytes
+        }
+
+    def clear(self):
+        """
+        Delete every cached entry.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        entries = self._entries()
+        for path, _ in entries:
+            os.remove(path)
+        return len(entries)
+
+
+def pack_results(results):
+    """
+    Convert run_simulation results to arrays for caching.
+
+    Each field is stacked over the results that have it, with the rows holding
+    it stored alongside, so fields kept only for top rosters stay compact.
+
+    Args:
+        results (List[dict]): Simulation results.
+
+    Returns:
+        dict: Arrays describing the results.
+    """
+    arrays = {"n_results": np.array(len(results))}
+    fields = list(dict.fromkeys(field for result in results for field in result))
+    for field in fields:
+        rows = [i for i, result in enumerate(results) if field in result]
+        arrays[f"rows:{field}"] = np.array(rows, dtype=np.int64)
+        arrays[f"data:{field}"] = np.array([results[i][field] for i in rows])
+        arrays[f"list:{field}"] = np.array(isinstance(results[rows[0]][field], list))
+    return arrays
+
+
+def unpack_results(arrays):
+    """
+    Rebuild run_simulation results from pack_results arrays.
+
+    Args:
+        arrays (dict): Arrays from pack_results.
+
+    Returns:
+        List[dict]: Simulation results.
+    """
+    results = [{} for _ in range(int(arrays["n_results"]))]
+    for name in arrays:
+        if not name.startswith("rows:"):
+            continue
+        field = name[len("rows:"):]
+        data = arrays[f"data:{field}"]
+        as_list = bool(arrays[f"list:{field}"])
+        for row, value in zip(arrays[name], data):
+            results[row][field] = value.tolist() if as_list else (value.item() if value.ndim == 0 else value)
+    return results
+
+
+def pack_frame(df):
+    """
+    Convert a DataFrame to arrays for caching.
+
+    Args:
+        df (pd.DataFrame): Frame to store.
+
+    Returns:
+        dict: Arrays holding the index, column order and column values.
+    """
+    import pandas as pd
+    arrays = {"index": df.index.to_numpy(), "columns": np.array(df.columns, dtype=str)}
+    for i, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        if values.dtype == object:
+            arrays[f"null:{i}"] = pd.isna(values)
+            values = np.where(arrays[f"null:{i}"], "", values).astype(str)
+        arrays[f"column:{i}"] = values
+    return arrays
+
+
+def unpack_frame(arrays):
+    """
+    Rebuild a DataFrame from pack_frame arrays.
+
+    Args:
+        arrays (dict): Arrays from pack_frame.
+
+    Returns:
+        pd.DataFrame: Restored frame.
+    """
+    import pandas as pd
+    data = {}
+    for i, column in enumerate(arrays["columns"]):
+        values = arrays[f"column:{i}"]
+        if f"null:{i}" in arrays:
+            values = np.where(arrays[f"null:{i}"], np.nan, values.astype(object))
+        data[str(column)] = values
+    return pd.DataFrame(data, index=arrays["index"])
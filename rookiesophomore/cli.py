@@ -1,42 +1,82 @@
 
+from typing import List
+
 import typer
-from rookiesophomore.ranking import build_roster
-from rookiesophomore.simulation import RosterSimulator, Player, RosterRequirements
-import pandas as pd
-import json
-
-app = typer.Typer()
-
-# Predefined roster types
-ROSTER_PRESETS = {
-    "standard": {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "FLEX": 1},
-    "superflex": {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "SUPERFLEX": 1},
-    "ppr": {"QB": 1, "RB": 2, "WR": 3, "TE": 1, "FLEX": 1},
-}
-
-def load_player_pool(file_path):
-    if file_path.endswith(".csv"):
-        df = pd.read_csv(file_path)
-        return [Player(row["name"], row.get("team", ""), row["position"], row["proj_floor"], row["proj_mean"], row["proj_ceiling"], row["proj_sd"]) for _, row in df.iterrows()]
-    elif file_path.endswith(".json"):
-        with open(file_path, "r") as f:
-            data = json.load(f)
-        return [Player(p["name"], p.get("team", ""), p["position"], p["proj_floor"], p["proj_mean"], p["proj_ceiling"], p["proj_sd"]) for p in data]
-    else:
-        raise ValueError("Unsupported player pool file format. Use CSV or JSON.")
+
+# Library modules are imported inside each command so that --help and quick
+# commands do not load numpy, pandas or matplotlib before they are needed.
+# Plain help output also skips importing rich's markdown and syntax renderers.
+app = typer.Typer(rich_markup_mode=None)
+cache_app = typer.Typer(help="Inspect or clear the result cache.", rich_markup_mode=None)
+app.add_typer(cache_app, name="cache")
+
+def print_rosters(results, roster_names):
+    for i, r in enumerate(results, 1):
+        typer.echo(f"Roster {i}: {roster_names(r['roster'])}")
+        typer.echo(f"Average Season Score: {r['average_score']:.2f}")
+        if "score_distribution" in r:
+            typer.echo(f"Min: {min(r['score_distribution']):.2f}  Max: {max(r['score_distribution']):.2f}")
+        else:
+            typer.echo(f"P10: {r['p10']:.2f}  P50: {r['p50']:.2f}  P90: {r['p90']:.2f}")
+        typer.echo("")
+
+def parse_lambda_grid(spec):
+    """Parse "0,0.5,1" or an inclusive "start:stop:step" range into risk levels."""
+    try:
+        if ":" in spec:
+            start, stop, step = (float(part) for part in spec.split(":"))
+        else:
+            lambdas = [float(part) for part in spec.split(",") if part.strip()]
+    except ValueError:
+        raise typer.BadParameter('expected "0,0.5,1" or "start:stop:step"', param_hint="--lambda-grid")
+    if ":" in spec:
+        if step <= 0:
+            raise typer.BadParameter("step must be positive", param_hint="--lambda-grid")
+        import numpy as np
+        lambdas = np.round(np.arange(start, stop + step / 2, step), 10).tolist()
+    if not lambdas:
+        raise typer.BadParameter("no risk levels in the grid", param_hint="--lambda-grid")
+    return lambdas
 
 @app.command()
 def rank(
     datafile: str,
     out_csv: str = "roster.csv",
-    risk_aversion: float = 1.0
+    risk_aversion: float = typer.Option(None, help="Risk aversion lambda [default: 1.0]; not used with --lambda-grid"),
+    lambda_grid: str = typer.Option(None, help='Risk levels to sweep in one pass, "0,0.5,1" or "start:stop:step"; writes long-format output'),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Recompute instead of reusing cached results; --lambda-grid sweeps are never cached")
 ):
     """Rank rookie and sophomore players from a CSV file."""
-    roster = build_roster(datafile, lambda_risk=risk_aversion)
+    if lambda_grid and risk_aversion is not None:
+        raise typer.BadParameter("use --lambda-grid or --risk-aversion, not both", param_hint="--risk-aversion")
+    from rookiesophomore.cache import ResultCache
+    from rookiesophomore.ranking import RISK_AVERSION, build_roster, build_roster_grid
+    if lambda_grid:
+        roster = build_roster_grid(datafile, parse_lambda_grid(lambda_grid))
+    else:
+        lambda_risk = RISK_AVERSION if risk_aversion is None else risk_aversion
+        roster = build_roster(datafile, lambda_risk=lambda_risk, cache=None if no_cache else ResultCache())
     roster.to_csv(out_csv, index=False)
     typer.echo(f"Roster saved to {out_csv}")
 
 
+@app.command("rank-archive")
+def rank_archive_command(
+    datafiles: List[str],
+    out_csv: str = "rosters.csv",
+    risk_aversion: float = 1.0,
+    group_by: List[str] = typer.Option(["season", "source"], help="Columns that define a group; missing columns are filled with the file name"),
+    chunksize: int = typer.Option(100_000, help="Rows read per chunk"),
+    processes: int = typer.Option(None, help="Worker processes for files and groups (default: serial)")
+):
+    """Rank every season/source group of a projection archive with bounded memory."""
+    from rookiesophomore.archive import rank_archive
+    rosters = rank_archive(datafiles, group_by=group_by, lambda_risk=risk_aversion,
+                           chunksize=chunksize, processes=processes)
+    rosters.to_csv(out_csv, index=False)
+    typer.echo(f"Rosters for {rosters.groupby(group_by).ngroups if len(rosters) else 0} group(s) saved to {out_csv}")
+
+
 @app.command()
 def simulate(
     player_pool_file: str = typer.Option(None, help="CSV or JSON file with player pool"),
@@ -47,15 +87,35 @@ def simulate(
     te: int = typer.Option(None, help="Number of TEs"),
     flex: int = typer.Option(None, help="Number of FLEX spots"),
     superflex: int = typer.Option(None, help="Number of SUPERFLEX spots"),
+    bench: int = typer.Option(0, help="Number of bench spots; each week starts the best legal lineup"),
     weeks: int = typer.Option(14, help="Number of weeks in the season"),
     simulations: int = typer.Option(1000, help="Number of simulation runs"),
     top_n: int = typer.Option(1, help="Number of top rosters to display"),
-    save_plot: str = typer.Option(None, help="Filename to save the plot (optional)")
+    save_plot: str = typer.Option(None, help="Filename to save the plot (optional)"),
+    optimize: bool = typer.Option(False, help="Simulate the exact best rosters by expected points instead of random samples"),
+    top_k: int = typer.Option(10, help="Number of best rosters to simulate with --optimize"),
+    summary: bool = typer.Option(False, help="Stream simulations and keep summary statistics instead of full distributions"),
+    session: str = typer.Option(None, help="Save a session file (.npz) for fast re-runs with the update command"),
+    seed: int = typer.Option(None, help="Random seed; seeded runs are reproducible and cached"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Recompute instead of reusing cached results"),
+    out: str = typer.Option(None, help="Write results to a columnar results directory for the report command"),
+    profile: bool = typer.Option(False, help="Print a per-stage timing and counter breakdown"),
+    profile_out: str = typer.Option(None, help="Write the profile to a file"),
+    profile_format: str = typer.Option("json", help="Profile file format: json, chrome (chrome://tracing) or text")
 ):
     """Run a roster simulation with configurable player pool and roster limits."""
+    from rookiesophomore.cache import ResultCache
+    from rookiesophomore.profiling import PROFILE_FORMATS, Profiler
+    from rookiesophomore.session import SimulationSession
+    from rookiesophomore.simulation import ROSTER_PRESETS, RosterRequirements, RosterSimulator
+    from rookiesophomore.tables import Player, load_player_pool
+    if profile_format not in PROFILE_FORMATS:
+        raise typer.BadParameter(f"expected one of {', '.join(PROFILE_FORMATS)}", param_hint="--profile-format")
+    profiler = Profiler(enabled=profile or bool(profile_out))
     # Load player pool
     if player_pool_file:
-        player_pool = load_player_pool(player_pool_file)
+        with profiler.stage("load_pool"):
+            player_pool = load_player_pool(player_pool_file)
     else:
         # Demo pool
         player_pool = [
@@ -80,26 +140,171 @@ def simulate(
         WR=wr if wr is not None else preset.get("WR", 0),
         TE=te if te is not None else preset.get("TE", 0),
         FLEX=flex if flex is not None else preset.get("FLEX", 0),
-        SUPERFLEX=superflex if superflex is not None else preset.get("SUPERFLEX", 0)
+        SUPERFLEX=superflex if superflex is not None else preset.get("SUPERFLEX", 0),
+        BENCH=bench
     )
 
-    sim = RosterSimulator(player_pool, req, weeks=weeks, simulations=simulations)
-    results = sim.run_simulation()
-    top_rosters = sorted(results, key=lambda x: x["average_score"], reverse=True)[:top_n]
-    for i, r in enumerate(top_rosters, 1):
-        typer.echo(f"Roster {i}: {r['roster']}")
-        typer.echo(f"Average Season Score: {r['average_score']:.2f}")
-        typer.echo(f"Min: {min(r['score_distribution']):.2f}  Max: {max(r['score_distribution']):.2f}")
+    sim = RosterSimulator(player_pool, req, weeks=weeks, simulations=simulations, seed=seed, profiler=profiler)
+    cache = None if no_cache else ResultCache()
+    if session:
+        rosters = sim.optimize(max(top_k, top_n)) if optimize else sim.generate_rosters()
+        try:
+            state = SimulationSession.start(sim, rosters)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--session")
+        state.save(session)
+        results = state.results(top_n)
+        typer.echo(f"Session saved to {session}")
+    elif optimize:
+        results = sim.run_simulation(max_rosters=max(top_k, top_n), optimize=True, summary=summary, keep_top=top_n,
+                                     cache=cache, out=out)
+    else:
+        results = sim.run_simulation(summary=summary, keep_top=top_n, cache=cache, out=out)
+    with profiler.stage("output"):
+        top_rosters = sorted(results, key=lambda x: x["average_score"], reverse=True)[:top_n]
+        print_rosters(top_rosters, sim.roster_names)
+        if save_plot:
+            import matplotlib.pyplot as plt
+            plt.hist(top_rosters[0]["score_distribution"], bins=30, alpha=0.7)
+            plt.title("Score Distribution for Top Roster")
+            plt.xlabel("Season Points")
+            plt.ylabel("Frequency")
+            plt.grid(True)
+            plt.savefig(save_plot)
+            typer.echo(f"Plot saved to {save_plot}")
+    if profile:
+        typer.echo(profiler.format())
+    if profile_out:
+        profiler.write(profile_out, format=profile_format)
+        typer.echo(f"Profile written to {profile_out}")
+
+@app.command()
+def update(
+    session_file: str,
+    player_pool_file: str = typer.Option(None, help="Updated CSV or JSON player pool; changed projections are applied"),
+    player: str = typer.Option(None, help="Name of a single player to update"),
+    mean: float = typer.Option(None, help="New projected mean for --player"),
+    sd: float = typer.Option(None, help="New projected standard deviation for --player"),
+    top_n: int = typer.Option(1, help="Number of top rosters to display")
+):
+    """Apply projection changes to a saved session and re-rank its rosters."""
+    from rookiesophomore.session import SimulationSession
+    from rookiesophomore.tables import load_player_pool
+    if not player and not player_pool_file:
+        raise typer.BadParameter("pass --player and/or --player-pool-file", param_hint="--player")
+    if player and mean is None and sd is None:
+        raise typer.BadParameter("pass --mean and/or --sd with --player", param_hint="--player")
+    state = SimulationSession.load(session_file)
+    changed = []
+    if player_pool_file:
+        changed += state.update_pool(load_player_pool(player_pool_file))
+    if player:
+        try:
+            state.update(player, proj_mean=mean, proj_sd=sd)
+        except KeyError as error:
+            raise typer.BadParameter(error.args[0], param_hint="--player")
+        changed.append(player)
+    state.save(session_file)
+    typer.echo(f"Updated {len(changed)} player(s): {', '.join(changed)}")
+    print_rosters(state.results(top_n), lambda roster: state.players.name[roster].tolist())
+
+@app.command()
+def report(
+    results_dir: str,
+    top_n: int = typer.Option(5, help="Number of rosters to display"),
+    sort_by: str = typer.Option("average_score", help="Summary column to sort by (average_score, std, p10, p50, p90)"),
+    ascending: bool = typer.Option(False, help="Sort smallest values first"),
+    min_score: float = typer.Option(None, help="Only rosters with at least this average score"),
+    player: str = typer.Option(None, help="Only rosters containing this player"),
+    save_plot: str = typer.Option(None, help="Filename to save the top roster's score distribution plot")
+):
+    """Sort, filter and display results written by simulate --out."""
+    from rookiesophomore.results import ResultsFile
+    results = ResultsFile(results_dir)
+    if sort_by not in results.columns:
+        raise typer.BadParameter(f"expected one of {', '.join(results.columns)}", param_hint="--sort-by")
+    if save_plot and not results.has_distributions:
+        raise typer.BadParameter("the results hold no score distributions", param_hint="--save-plot")
+    where = None
+    if min_score is not None:
+        where = results.column("average_score") >= min_score
+    if player:
+        contains = results.containing(player)
+        where = contains if where is None else where & contains
+    rows = results.top(top_n, by=sort_by, ascending=ascending, where=where)
+    if save_plot and len(rows) and results.distribution(rows[0]) is None:
+        raise typer.BadParameter("the top roster's score distribution was not kept", param_hint="--save-plot")
+    for i, row in enumerate(rows, 1):
+        typer.echo(f"Roster {i}: {results.names(row)}")
+        typer.echo("  ".join(f"{column}: {results.column(column)[row]:.2f}" for column in results.columns))
         typer.echo("")
-    if save_plot:
-        import matplotlib.pyplot as plt
-        plt.hist(top_rosters[0]["score_distribution"], bins=30, alpha=0.7)
-        plt.title("Score Distribution for Top Roster")
-        plt.xlabel("Season Points")
-        plt.ylabel("Frequency")
-        plt.grid(True)
-        plt.savefig(save_plot)
+    if save_plot and len(rows):
+        results.plot(rows[0], save=save_plot)
         typer.echo(f"Plot saved to {save_plot}")
 
+@app.command()
+def bench(
+    case: List[str] = typer.Option(None, help="Benchmark case to run (repeatable); default: all"),
+    pool_size: int = typer.Option(500, help="Players in the synthetic pool"),
+    roster_type: str = typer.Option("standard", help="Roster shape (standard, superflex, ppr)"),
+    weeks: int = typer.Option(14, help="Number of weeks in the season"),
+    simulations: int = typer.Option(1000, help="Number of simulation runs"),
+    rosters: int = typer.Option(1000, help="Number of rosters to generate and simulate"),
+    repeat: int = typer.Option(3, help="Timed runs per case; the fastest is reported"),
+    baseline: str = typer.Option(None, help="JSON baseline to compare against"),
+    save_baseline: str = typer.Option(None, help="Write this run as a JSON baseline"),
+    threshold: float = typer.Option(0.2, help="Allowed slowdown against the baseline before failing, e.g. 0.2 for 20%"),
+    startup_budget: float = typer.Option(0.2, help="Seconds allowed for the import_package and cli_help cases")
+):
+    """Benchmark roster generation, simulation and ranking on synthetic data."""
+    from rookiesophomore import bench as benchmarks
+    from rookiesophomore.simulation import ROSTER_PRESETS
+    if roster_type not in ROSTER_PRESETS:
+        raise typer.BadParameter(f"expected one of {', '.join(ROSTER_PRESETS)}", param_hint="--roster-type")
+    unknown = sorted(set(case or ()) - set(benchmarks.CASES))
+    if unknown:
+        raise typer.BadParameter(f"unknown cases {', '.join(unknown)}", param_hint="--case")
+    reference = benchmarks.load_baseline(baseline) if baseline else None
+    if reference:
+        # Refuse before the run rather than after minutes of timing
+        params = {"pool_size": pool_size, "roster_type": roster_type, "weeks": weeks,
+                  "simulations": simulations, "n_rosters": rosters, "seed": 0}
+        mismatched = benchmarks.mismatched_params(params, reference)
+        if mismatched:
+            raise typer.BadParameter(f"baseline params differ: {'; '.join(mismatched)}", param_hint="--baseline")
+    report = benchmarks.run_benchmarks(pool_size=pool_size, roster_type=roster_type, weeks=weeks,
+                                       simulations=simulations, n_rosters=rosters, repeat=repeat, cases=case or None)
+    typer.echo(benchmarks.format_report(report, reference))
+    if save_baseline:
+        benchmarks.save_baseline(report, save_baseline)
+        typer.echo(f"Baseline saved to {save_baseline}")
+    failed = False
+    for problem in benchmarks.check_startup(report, startup_budget):
+        typer.echo(f"Startup: {problem}")
+        failed = True
+    if reference:
+        regressions = benchmarks.compare(report, reference, threshold)
+        for regression in regressions:
+            typer.echo(f"Regression: {regression['case']} {regression['baseline']:.4f}s -> "
+                       f"{regression['current']:.4f}s ({regression['ratio'] - 1:+.1%})")
+            failed = True
+    if failed:
+        raise typer.Exit(code=1)
+
+@cache_app.command("stats")
+def cache_stats():
+    """Show the cache location, number of entries and size."""
+    from rookiesophomore.cache import ResultCache
+    stats = ResultCache().stats()
+    typer.echo(f"Directory: {stats['directory']}")
+    typer.echo(f"Entries: {stats['entries']}")
+    typer.echo(f"Size: {stats['bytes'] / 1024 ** 2:.1f} MB of {stats['max_bytes'] / 1024 ** 2:.0f} MB")
+
+@cache_app.command("clear")
+def cache_clear():
+    """Delete every cached result."""
+    from rookiesophomore.cache import ResultCache
+    typer.echo(f"Removed {ResultCache().clear()} cached result(s)")
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,172 @@
+"""
+Team-based correlation model for weekly player scores.
+"""
+import numpy as np
+
+
+class CorrelationModel:
+    """
+    Correlates weekly scores of players on the same team.
+
+    Players on different teams, or without a team, are independent, so the
+    correlation matrix is block-diagonal by team. Each block is factored once
+    and sampling costs grow with the number of teams times the squared team
+    size rather than with the squared size of the player pool.
+
+    Args:
+        team_corr (float): Correlation between any two teammates.
+        position_pairs (dict, optional): Correlation for teammates at a pair of
+            positions, e.g. {("QB", "WR"): 0.35}. Pairs are symmetric and
+            override team_corr.
+    """
+    def __init__(self, team_corr=0.0, position_pairs=None):
+        self.team_corr = team_corr
+        self.position_pairs = {}
+        for (a, b), rho in (position_pairs or {}).items():
+            self.position_pairs[a, b] = rho
+            self.position_pairs[b, a] = rho
+
+    def pair_correlation(self, pos_a, pos_b):
+        """
+        Correlation between two teammates.
+
+        Args:
+            pos_a (str): Position of the first player.
+            pos_b (str): Position of the second player.
+
+        Returns:
+            float: Correlation coefficient.
+        """
+        return self.position_pairs.get((pos_a, pos_b), self.team_corr)
+
+    def correlation_matrix(self, positions, teams):
+        """
+        Correlation matrix for a set of players.
+
+        Args:
+            positions (np.ndarray): Player positions.
+            teams (np.ndarray): Player teams; empty teams are independent.
+
+        Returns:
+            np.ndarray: (n, n) positive semi-definite correlation matrix.
+        """
+        n = len(positions)
+        corr = np.eye(n)
+        for i in range(n):
+            for j in range(i + 1, n):
+                if teams[i] and teams[i] == teams[j]:
+                    corr[i, j] = corr[j, i] = self.pair_correlation(positions[i], positions[j])
+        return _nearest_correlation(corr)
+
+    def cholesky(self, positions, teams):
+        """
+        Lower-triangular factor of the correlation matrix for a set of players.
+
+        Args:
+            positions (np.ndarray): Player positions.
+            teams (np.ndarray): Player teams.
+
+        Returns:
+            np.ndarray: (n, n) factor L with L @ L.T equal to the correlation matrix.
+        """
+        return _factor(self.correlation_matrix(positions, teams))
+
+    def factor(self, players):
+        """
+        Factor the block-diagonal correlation structure of a player pool.
+
+        Args:
+            players (PlayerTable): Player pool.
+
+        Returns:
+            CorrelationFactor: Per-team factors ready for sampling.
+        """
+        team_members = {}
+        for i, team in enumerate(players.team):
+            if team:
+                team_members.setdefault(team, []).append(i)
+        blocks = [members for members in team_members.values() if len(members) > 1]
+        width = max((len(members) for members in blocks), default=0)
+        members = np.full((len(blocks), width), -1, dtype=np.int64)
+        # Padding rows/columns of each factor are identity, so they never mix into real players
+        factors = np.tile(np.eye(width), (len(blocks), 1, 1))
+        for t, block in enumerate(blocks):
+            members[t, :len(block)] = block
+            factors[t, :len(block), :len(block)] = self.cholesky(players.position[block], players.team[block])
+        return CorrelationFactor(len(players), members, factors)
+
+
+class CorrelationFactor:
+    """
+    Block-diagonal factor of a player pool's correlation matrix.
+
+    Args:
+        n_players (int): Number of players in the pool.
+        members (np.ndarray): (n_blocks, width) player indices per team, -1 padded.
+        factors (np.ndarray): (n_blocks, width, width) lower-triangular factors.
+    """
+    def __init__(self, n_players, members, factors):
+        self.n_players = n_players
+        self.members = members
+        self.factors = factors
+        valid = members >= 0
+        self._flat_valid = valid.ravel()
+        self._flat_members = members[valid]
+        self._solo = np.setdiff1d(np.arange(n_players), self._flat_members)
+
+    def standard_normal(self, rng, size):
+        """
+        Draw correlated standard normal scores for every player.
+
+        Args:
+            rng (np.random.Generator): Random generator.
+            size (int or tuple): Leading shape of the draw.
+
+        Returns:
+            np.ndarray: size + (n_players,) correlated standard normals.
+        """
+        size = (size,) if np.isscalar(size) else tuple(size)
+        out = np.empty(size + (self.n_players,))
+        out[..., self._solo] = rng.standard_normal(size + (len(self._solo),))
+        if len(self.members):
+            n_blocks, width = self.members.shape
+            blocks = rng.standard_normal((int(np.prod(size)), n_blocks, width))
+            # Batched (draws, width) @ (width, width) product per team block
+            correlated = np.matmul(blocks.transpose(1, 0, 2), self.factors.transpose(0, 2, 1)).transpose(1, 0, 2)
+            out[..., self._flat_members] = correlated.reshape(size + (-1,))[..., self._flat_valid]
+        return out
+
+
+def _nearest_correlation(corr):
+    """
+    Repair a symmetric matrix into a valid correlation matrix.
+
+    Args:
+        corr (np.ndarray): Symmetric matrix with unit diagonal.
+
+    Returns:
+        np.ndarray: Positive semi-definite matrix with unit diagonal.
+    """
+    values, vectors = np.linalg.eigh(corr)
+    if values.min() >= 0:
+        return corr
+    repaired = (vectors * np.maximum(values, 1e-10)) @ vectors.T
+    scale = np.sqrt(np.diag(repaired))
+    return repaired / np.outer(scale, scale)
+
+
+def _factor(corr):
+    """
+    Lower-triangular factor of a positive semi-definite matrix.
+
+    Args:
+        corr (np.ndarray): Correlation matrix.
+
+    Returns:
+        np.ndarray: Factor L with L @ L.T == corr.
+    """
+    try:
+        return np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        # Singular but valid matrices: fall back to a jittered factor
+        return np.linalg.cholesky(corr + 1e-8 * np.eye(len(corr)))
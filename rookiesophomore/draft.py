@@ -0,0 +1,253 @@
+"""
+Vectorized mock-draft engine.
+"""
+import numpy as np
+
+from .tables import RosterBatch
+
+# Candidates inspected per pick before falling back to a full scan of the pool
+WINDOW = 32
+# Risk aversion of the default ADP board; the same default as ranking.RISK_AVERSION,
+# defined here so the draft engine does not import pandas through ranking
+ADP_RISK_AVERSION = 1.0
+
+
+def snake_order(n_teams, rounds):
+    """
+    Team on the clock for every pick of a snake draft.
+
+    Args:
+        n_teams (int): Number of teams.
+        rounds (int): Number of rounds.
+
+    Returns:
+        np.ndarray: (n_teams * rounds,) team index per pick.
+    """
+    order = np.tile(np.arange(n_teams), (rounds, 1))
+    order[1::2] = order[1::2, ::-1]
+    return order.ravel()
+
+
+class MockDraftResult:
+    """
+    Outcome of a batch of mock drafts.
+
+    Args:
+        players (PlayerTable): Player pool.
+        picks (np.ndarray): (n_drafts, n_picks) player taken with each pick.
+        order (np.ndarray): (n_picks,) team on the clock for each pick.
+        n_teams (int): Number of teams.
+        team_requirements (List[RosterRequirements], optional): Requirements each team
+            drafted to; projections start lineups under them.
+    """
+    def __init__(self, players, picks, order, n_teams, team_requirements=None):
+        self.players = players
+        self.picks = picks
+        self.order = order
+        self.n_teams = n_teams
+        self.team_requirements = team_requirements
+
+    @property
+    def n_drafts(self):
+        return len(self.picks)
+
+    def pick_numbers(self):
+        """
+        Pick at which each player went in each draft.
+
+        Returns:
+            np.ndarray: (n_drafts, n_players) zero-based pick, n_picks when undrafted.
+        """
+        n_picks = self.picks.shape[1]
+        out = np.full((self.n_drafts, len(self.players)), n_picks, dtype=np.int64)
+        np.put_along_axis(out, self.picks, np.arange(n_picks)[None, :], axis=1)
+        return out
+
+    def availability(self):
+        """
+        Probability that each player is still on the board at each pick.
+
+        Returns:
+            np.ndarray: (n_players, n_picks) probability the player is available
+            when pick k is made.
+        """
+        n_picks = self.picks.shape[1]
+        taken_at = self.pick_numbers()
+        flat = (np.arange(len(self.players))[None, :] * (n_picks + 1) + taken_at).ravel()
+        counts = np.bincount(flat, minlength=len(self.players) * (n_picks + 1)).reshape(-1, n_picks + 1)
+        # Available at pick k when taken at pick k or later
+        return np.cumsum(counts[:, ::-1], axis=1)[:, ::-1][:, :n_picks] / self.n_drafts
+
+    def rosters(self, team=None):
+        """
+        Drafted rosters as a RosterBatch.
+
+        Args:
+            team (int, optional): Only this team's roster from each draft.
+
+        Returns:
+            RosterBatch: One row per draft and team (draft-major), or per draft
+            when team is given.
+        """
+        rounds = self.picks.shape[1] // self.n_teams
+        teams = [team] if team is not None else range(self.n_teams)
+        index = np.stack([self.picks[:, self.order == t] for t in teams], axis=1)
+        return RosterBatch(self.players, index.reshape(-1, rounds))
+
+    def project(self, simulator, team=None):
+        """
+        Projected season distribution of drafted rosters.
+
+        Drafted rosters include bench players, so each simulated week starts the
+        best legal lineup under the team's requirements, or the simulator's when
+        the draft had none per team. Teams sharing requirements are simulated together.
+
+        Args:
+            simulator (RosterSimulator): Simulator over the same player pool.
+            team (int, optional): Only project this team's rosters.
+
+        Returns:
+            np.ndarray: (n_rosters, simulations) season totals, rows ordered as rosters(team).
+        """
+        teams = [team] if team is not None else list(range(self.n_teams))
+        requirements = self.team_requirements or [simulator.requirements] * self.n_teams
+        index = self.rosters(team).index.reshape(self.n_drafts, len(teams), -1)
+        out = np.empty((self.n_drafts, len(teams), simulator.simulations))
+        shared = {id(requirements[t]): requirements[t] for t in teams}
+        for key, req in shared.items():
+            cols = [j for j, t in enumerate(teams) if id(requirements[t]) == key]
+            batch = RosterBatch(self.players, index[:, cols].reshape(-1, index.shape[2]))
+            scores = simulator.simulate_lineups(batch, requirements=req)
+            out[:, cols] = scores.reshape(self.n_drafts, len(cols), -1)
+        return out.reshape(-1, simulator.simulations)
+
+
+class DraftSimulator:
+    """
+    Runs many snake drafts at once against a noisy ADP board.
+
+    Every manager takes the available player with the best noisy ADP whose
+    position still fits their roster, and switches to open starting positions
+    once the remaining picks are needed to fill them. Each pick is one array
+    step across all drafts.
+
+    Args:
+        simulator (RosterSimulator): Supplies the player pool, requirements and generator.
+        n_teams (int): Number of teams.
+        rounds (int): Number of rounds.
+        adp (array-like, optional): Average draft position per player. Defaults to
+            the rank by risk-adjusted projection, proj_mean - ADP_RISK_AVERSION * proj_sd.
+        adp_sd (float or array-like, optional): Standard deviation of ADP noise.
+            Defaults to 1 + 10% of ADP.
+        team_requirements (List[RosterRequirements], optional): Requirements per team;
+            defaults to the simulator's requirements for every team.
+    """
+    def __init__(self, simulator, n_teams=12, rounds=15, adp=None, adp_sd=None, team_requirements=None):
+        self.simulator = simulator
+        self.players = simulator.players
+        self.n_teams = n_teams
+        self.rounds = rounds
+        if adp is None:
+            score = self.players.proj_mean - ADP_RISK_AVERSION * self.players.proj_sd
+            adp = np.argsort(np.argsort(-score, kind="stable"), kind="stable") + 1.0
+        self.adp = np.asarray(adp, dtype=np.float64)
+        self.adp_sd = np.broadcast_to(1 + 0.1 * self.adp if adp_sd is None else adp_sd, self.adp.shape)
+        self.team_requirements = team_requirements or [simulator.requirements] * n_teams
+
+    def _position_limits(self, labels):
+        """
+        Needed and maximum players per team and position.
+
+        Args:
+            labels (np.ndarray): Position labels.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (n_teams, n_positions) starters needed and caps.
+        """
+        need = np.zeros((self.n_teams, len(labels)), dtype=np.int64)
+        cap = np.zeros_like(need)
+        for t, req in enumerate(self.team_requirements):
+            groups = req.slot_groups()
+            starters = sum(count for _, count, _ in groups)
+            bench = max(req.BENCH, self.rounds - starters)
+            for p, label in enumerate(labels):
+                slots = sum(count for _, count, eligible in groups if label in eligible)
+                need[t, p] = sum(count for _, count, eligible in groups if eligible == [label])
+                cap[t, p] = slots + bench if slots else 0
+        return need, cap
+
+    def run(self, n_drafts=1000):
+        """
+        Simulate a batch of drafts.
+
+        Args:
+            n_drafts (int): Number of drafts.
+
+        Returns:
+            MockDraftResult: Picks of every draft.
+        """
+        rng = self.simulator.rng
+        n_players = len(self.players)
+        order = snake_order(self.n_teams, self.rounds)
+        if len(order) > n_players:
+            raise ValueError("Player pool is smaller than the number of picks.")
+        labels, codes = np.unique(self.players.position, return_inverse=True)
+        need, cap = self._position_limits(labels)
+
+        noisy = self.adp + self.adp_sd * rng.standard_normal((n_drafts, n_players))
+        board = np.argsort(noisy, axis=1)
+        board_codes = codes[board]
+        taken = np.zeros((n_drafts, n_players), dtype=bool)
+        counts = np.zeros((n_drafts, self.n_teams, len(labels)), dtype=np.int64)
+        head = np.zeros(n_drafts, dtype=np.int64)
+        picks = np.empty((n_drafts, len(order)), dtype=np.int64)
+        rows = np.arange(n_drafts)
+        window = np.arange(WINDOW)
+
+        for k, team in enumerate(order):
+            held = counts[:, team]
+            picks_left = self.rounds - k // self.n_teams
+            short = np.maximum(need[team] - held, 0)
+            # Once every remaining pick is needed for an open starter, only those positions qualify
+            forced = short.sum(axis=1) >= picks_left
+            fits = (held < cap[team]) & (~forced[:, None] | (short > 0))
+
+            cols = np.minimum(head[:, None] + window, n_players - 1)
+            ok = ~taken[rows[:, None], cols] & fits[rows[:, None], board_codes[rows[:, None], cols]]
+            slot = cols[rows, ok.argmax(axis=1)]
+            missed = np.flatnonzero(~ok.any(axis=1))
+            if len(missed):
+                full = ~taken[missed] & fits[missed[:, None], board_codes[missed]]
+                # No position fits: take the best player left
+                stuck = ~full.any(axis=1)
+                full[stuck] = ~taken[missed[stuck]]
+                slot[missed] = full.argmax(axis=1)
+
+            taken[rows, slot] = True
+            player = board[rows, slot]
+            picks[:, k] = player
+            counts[rows, team, codes[player]] += 1
+            head = self._advance(head, taken)
+        return MockDraftResult(self.players, picks, order, self.n_teams, self.team_requirements)
+
+    @staticmethod
+    def _advance(head, taken):
+        """
+        Move each draft's head to its best remaining board position.
+
+        Args:
+            head (np.ndarray): Current head per draft.
+            taken (np.ndarray): (n_drafts, n_players) board positions already taken.
+
+        Returns:
+            np.ndarray: Updated heads.
+        """
+        n_players = taken.shape[1]
+        moving = np.flatnonzero(taken[np.arange(len(head)), np.minimum(head, n_players - 1)] & (head < n_players))
+        while len(moving):
+            cols = np.minimum(head[moving, None] + np.arange(WINDOW), n_players - 1)
+            free = ~taken[moving[:, None], cols]
+            step = np.where(free.any(axis=1), free.argmax(axis=1), WINDOW)
+            head[moving] = np.minimum(head[moving] + step, n_players)
+            moving = moving[~free.any(axis=1) & (head[moving] < n_players)]
+        return head
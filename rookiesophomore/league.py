@@ -0,0 +1,153 @@
+"""
+Head-to-head league simulation: weekly matchups, standings and playoff odds.
+"""
+import numpy as np
+
+
+def round_robin_schedule(n_teams, weeks):
+    """
+    Build a round-robin schedule, repeating the rotation as needed.
+
+    Args:
+        n_teams (int): Number of teams.
+        weeks (int): Number of weeks.
+
+    Returns:
+        np.ndarray: (weeks, n_teams) opponent of each team each week, -1 for a bye.
+    """
+    slots = n_teams + n_teams % 2
+    rotation = list(range(slots))
+    schedule = np.full((weeks, n_teams), -1, dtype=np.int64)
+    for week in range(weeks):
+        # Circle method: the first slot stays fixed, the rest rotate one step per week
+        turn = week % (slots - 1)
+        order = [rotation[0]] + rotation[1:][turn:] + rotation[1:][:turn]
+        for home, away in zip(order[:slots // 2], order[::-1][:slots // 2]):
+            if home < n_teams and away < n_teams:
+                schedule[week, home] = away
+                schedule[week, away] = home
+    return schedule
+
+
+class LeagueResult:
+    """
+    Aggregated outcome of many simulated league seasons.
+
+    Args:
+        simulations (int): Number of simulated seasons.
+        wins (np.ndarray): (n_teams,) mean wins per team.
+        points_for (np.ndarray): (n_teams,) mean season points per team.
+        rank_counts (np.ndarray): (n_teams, n_teams) seasons each team finished at each rank.
+        head_to_head (np.ndarray): (n_teams, n_teams) probability team i outscores
+            team j in a given week.
+        playoff_teams (int): Number of teams that make the playoffs.
+    """
+    def __init__(self, simulations, wins, points_for, rank_counts, head_to_head, playoff_teams):
+        self.simulations = simulations
+        self.wins = wins
+        self.points_for = points_for
+        self.rank_counts = rank_counts
+        self.head_to_head = head_to_head
+        self.playoff_teams = playoff_teams
+
+    @property
+    def rank_probabilities(self):
+        """(n_teams, n_teams) probability that each team finishes at each rank."""
+        return self.rank_counts / self.simulations
+
+    @property
+    def playoff_odds(self):
+        """(n_teams,) probability that each team makes the playoffs."""
+        return self.rank_probabilities[:, :self.playoff_teams].sum(axis=1)
+
+    @property
+    def title_odds(self):
+        """(n_teams,) probability that each team finishes first in the standings."""
+        return self.rank_probabilities[:, 0]
+
+
+class LeagueSimulator:
+    """
+    Simulates head-to-head seasons for a league of rosters.
+
+    Weekly scores for every team come from RosterSimulator.weekly_points in one
+    tensor per chunk of seasons; matchups, standings and tiebreaks are array
+    comparisons across all simulated seasons.
+
+    Args:
+        simulator (RosterSimulator): Supplies the draw machinery, weeks and simulations.
+        rosters (RosterBatch): One roster per team.
+        schedule (np.ndarray, optional): (weeks, n_teams) opponent per team per week,
+            -1 for a bye. Defaults to round_robin_schedule.
+        playoff_teams (int): Number of teams that make the playoffs.
+    """
+    def __init__(self, simulator, rosters, schedule=None, playoff_teams=4):
+        self.simulator = simulator
+        self.rosters = rosters
+        n_teams = len(rosters)
+        self.schedule = (np.asarray(schedule, dtype=np.int64) if schedule is not None
+                         else round_robin_schedule(n_teams, simulator.weeks))
+        if self.schedule.shape != (simulator.weeks, n_teams):
+            raise ValueError("Schedule must have one row per week and one column per team.")
+        self.playoff_teams = playoff_teams
+
+    def standings(self, scores):
+        """
+        Wins, points and final rank for each simulated season.
+
+        Teams are ranked by wins, with ties broken by points scored.
+
+        Args:
+            scores (np.ndarray): (simulations, weeks, n_teams) weekly points.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (simulations, n_teams) wins,
+            points for and zero-based rank.
+        """
+        has_game = self.schedule >= 0
+        opponent = np.take_along_axis(scores, np.where(has_game, self.schedule, 0)[None], axis=2)
+        result = np.where(scores > opponent, 1.0, np.where(scores == opponent, 0.5, 0.0))
+        wins = np.where(has_game, result, 0).sum(axis=1)
+        points_for = scores.sum(axis=1)
+        # Last key is primary: most wins first, then most points
+        order = np.lexsort((-points_for, -wins), axis=1)
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(order.shape[1])[None, :], axis=1)
+        return wins, points_for, rank
+
+    def run(self, chunk_size=10000):
+        """
+        Simulate simulator.simulations league seasons.
+
+        Args:
+            chunk_size (int): Seasons simulated per chunk, bounding memory.
+
+        Returns:
+            LeagueResult: Expected wins and points, rank and playoff probabilities,
+            and the weekly head-to-head win-probability table.
+        """
+        sim = self.simulator
+        n_teams = len(self.rosters)
+        wins = np.zeros(n_teams)
+        points_for = np.zeros(n_teams)
+        rank_counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+        head_to_head = np.zeros((n_teams, n_teams))
+        sizes = [min(chunk_size, sim.simulations - start) for start in range(0, sim.simulations, chunk_size)]
+        for size, seed in zip(sizes, sim.seed_sequence.spawn(len(sizes))):
+            scores = sim.weekly_points(self.rosters, simulations=size, rng=np.random.default_rng(seed))
+            chunk_wins, chunk_points, rank = self.standings(scores)
+            wins += chunk_wins.sum(axis=0)
+            points_for += chunk_points.sum(axis=0)
+            flat_rank = (rank + np.arange(n_teams) * n_teams).ravel()
+            rank_counts += np.bincount(flat_rank, minlength=n_teams * n_teams).reshape(n_teams, n_teams)
+            flat = scores.reshape(-1, n_teams)
+            head_to_head += (flat[:, :, None] > flat[:, None, :]).sum(axis=0)
+        total = sum(sizes)
+        return LeagueResult(
+            total,
+            wins / total,
+            points_for / total,
+            rank_counts,
+            head_to_head / (total * sim.weeks),
+            self.playoff_teams
+        )
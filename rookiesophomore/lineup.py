@@ -0,0 +1,85 @@
+"""
+Vectorized weekly start/sit selection.
+"""
+import numpy as np
+
+# Gap between position blocks in the sort key; far beyond any weekly score
+POSITION_SPACING = 1e6
+
+
+def best_lineup_points(scores, positions, requirements):
+    """
+    Points scored by the best legal lineup for every roster, week and simulation.
+
+    Slot groups are filled in order (dedicated positions, then FLEX, then
+    SUPERFLEX) with the top remaining eligible scores. Because each group's
+    eligibility contains the previous groups', filling greedily in this order is
+    optimal. Slots with no eligible player left score zero.
+
+    Each row is sorted once with the position folded into the sort key, which
+    groups a roster's players by position in ascending score order. Roster
+    composition does not change between weeks, so where each position's best
+    players land after the sort is known up front and dedicated slots are read
+    with a fixed gather. Only the few remaining candidates compete for flex slots.
+
+    Args:
+        scores (np.ndarray): (..., n_rosters, roster_size) weekly points of each
+            rostered player, starters and bench alike.
+        positions (np.ndarray): (n_rosters, roster_size) positions of the rostered players.
+        requirements (RosterRequirements): Starting lineup requirements.
+
+    Returns:
+        np.ndarray: scores.shape[:-1] lineup totals.
+    """
+    positions = np.asarray(positions)
+    labels, codes = np.unique(positions, return_inverse=True)
+    codes = codes.reshape(positions.shape)
+    n_rosters = positions.shape[0]
+    rows = np.arange(n_rosters)[:, None]
+
+    # Fold the position into the key: sorted rows hold position blocks in label order
+    spacing = POSITION_SPACING
+    keyed = scores + codes * spacing
+    keyed.sort(axis=-1)
+    counts = (codes[..., None] == np.arange(len(labels))).sum(axis=1)
+    ends = np.cumsum(counts, axis=1)
+    used = np.zeros_like(counts)
+
+    def gather(code, depth):
+        # The depth best remaining players at a position, -inf where the roster runs out
+        j = np.arange(depth)
+        idx = ends[:, code, None] - 1 - used[:, code, None] - j
+        valid = used[:, code, None] + j < counts[:, code, None]
+        values = keyed[..., rows, np.where(valid, idx, 0)] - code * spacing
+        return np.where(valid, values, -np.inf)
+
+    total = np.zeros(scores.shape[:-1])
+    groups = [(count, eligible) for _, count, eligible in requirements.slot_groups() if count > 0]
+    dedicated = [(count, eligible[0]) for count, eligible in groups if len(eligible) == 1]
+    flexible = [(count, eligible) for count, eligible in groups if len(eligible) > 1]
+    for count, pos in dedicated:
+        if pos not in labels:
+            continue
+        code = np.searchsorted(labels, pos)
+        picked = gather(code, count)
+        total += np.where(np.isfinite(picked), picked, 0).sum(axis=-1)
+        used[:, code] = np.minimum(used[:, code] + count, counts[:, code])
+
+    if flexible:
+        depth = sum(count for count, _ in flexible)
+        eligible_codes = [code for code, label in enumerate(labels)
+                          if any(label in eligible for _, eligible in flexible)]
+        if eligible_codes:
+            candidates = np.concatenate([gather(code, depth) for code in eligible_codes], axis=-1)
+            tags = np.repeat(labels[eligible_codes], depth)
+            for count, eligible in flexible:
+                mask = np.isin(tags, eligible)
+                for _ in range(count):
+                    masked = np.where(mask, candidates, -np.inf)
+                    best = masked.argmax(axis=-1)[..., None]
+                    picked = np.take_along_axis(masked, best, axis=-1)[..., 0]
+                    started = np.isfinite(picked)
+                    total += np.where(started, picked, 0)
+                    kept = np.take_along_axis(candidates, best, axis=-1)
+                    np.put_along_axis(candidates, best, np.where(started[..., None], -np.inf, kept), axis=-1)
+    return total
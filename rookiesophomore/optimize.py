@@ -0,0 +1,159 @@
+"""
+Exact top-K roster optimization by expected points.
+"""
+import heapq
+import itertools
+
+import numpy as np
+
+from .tables import RosterBatch
+
+
+def _compositions(total, parts):
+    """
+    Yield every way to split total slots across parts.
+
+    Args:
+        total (int): Number of slots to distribute.
+        parts (int): Number of receiving positions.
+
+    Yields:
+        Tuple[int, ...]: Slots given to each part.
+    """
+    if parts == 0:
+        if total == 0:
+            yield ()
+        return
+    for bars in itertools.combinations(range(total + parts - 1), parts - 1):
+        bounds = (-1,) + bars + (total + parts - 1,)
+        yield tuple(bounds[i + 1] - bounds[i] - 1 for i in range(parts))
+
+
+def _top_subsets(values, size, k):
+    """
+    Find the k subsets of a given size with the largest sums.
+
+    Args:
+        values (np.ndarray): Values sorted in descending order.
+        size (int): Subset size.
+        k (int): Number of subsets to return.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Subset sums (descending) and a
+        (n_subsets, size) matrix of positions into values.
+    """
+    if size == 0:
+        return np.zeros(1), np.empty((1, 0), dtype=np.int64)
+    if size > len(values):
+        return np.empty(0), np.empty((0, size), dtype=np.int64)
+    # Best-first search: moving one member to the next lower value never increases the sum
+    start = tuple(range(size))
+    heap = [(-values[:size].sum(), start)]
+    seen = {start}
+    sums, members = [], []
+    while heap and len(sums) < k:
+        neg_sum, combo = heapq.heappop(heap)
+        sums.append(-neg_sum)
+        members.append(combo)
+        for j in range(size):
+            nxt = combo[j] + 1
+            if nxt < len(values) and (j == size - 1 or nxt < combo[j + 1]):
+                child = combo[:j] + (nxt,) + combo[j + 1:]
+                if child not in seen:
+                    seen.add(child)
+                    heapq.heappush(heap, (neg_sum + values[combo[j]] - values[nxt], child))
+    return np.array(sums), np.array(members, dtype=np.int64)
+
+
+def _top_k(sums, k):
+    """
+    Positions of the k largest sums, best first.
+
+    Args:
+        sums (np.ndarray): Candidate sums.
+        k (int): Number to keep.
+
+    Returns:
+        np.ndarray: Indices into sums.
+    """
+    if len(sums) > k:
+        keep = np.argpartition(-sums, k - 1)[:k]
+    else:
+        keep = np.arange(len(sums))
+    return keep[np.argsort(-sums[keep], kind="stable")]
+
+
+def top_rosters(players, requirements, k=10):
+    """
+    Find the exact k rosters with the highest expected points.
+
+    Expected points are additive over players, so the best rosters follow from the
+    projections without simulation. For each way of assigning FLEX and SUPERFLEX
+    slots to eligible positions, the best player subsets per position are merged
+    into the best rosters. A player with at least k better players at a position
+    that can hold its whole slot allotment is dominated and pruned up front.
+
+    Bench spots do not score, so the rosters contain starters only.
+
+    Args:
+        players (PlayerTable): Player pool.
+        requirements (RosterRequirements): Roster requirements.
+        k (int): Number of rosters to return.
+
+    Returns:
+        RosterBatch: Up to k rosters of starters, best first.
+    """
+    groups = requirements.slot_groups()
+    dedicated = {slot: count for slot, count, _ in groups if slot not in ("FLEX", "SUPERFLEX")}
+    flex_positions = list(dict.fromkeys(requirements.flex_positions))
+    superflex_positions = list(dict.fromkeys(requirements.superflex_positions))
+    positions = list(dict.fromkeys(list(dedicated) + flex_positions + superflex_positions))
+    roster_size = sum(count for _, count, _ in groups)
+
+    # Sorted, pruned candidates per position
+    candidates = {}
+    for pos in positions:
+        idx = np.flatnonzero(players.position == pos)
+        idx = idx[np.argsort(-players.proj_mean[idx], kind="stable")]
+        capacity = (dedicated.get(pos, 0)
+                    + requirements.FLEX * (pos in flex_positions)
+                    + requirements.SUPERFLEX * (pos in superflex_positions))
+        candidates[pos] = idx[:capacity + k - 1]
+
+    allocations = set()
+    for flex in _compositions(requirements.FLEX, len(flex_positions)):
+        for superflex in _compositions(requirements.SUPERFLEX, len(superflex_positions)):
+            counts = dict(dedicated)
+            for pos, n in zip(flex_positions, flex):
+                counts[pos] = counts.get(pos, 0) + n
+            for pos, n in zip(superflex_positions, superflex):
+                counts[pos] = counts.get(pos, 0) + n
+            allocations.add(tuple(counts.get(pos, 0) for pos in positions))
+
+    subsets = {}
+    best_sums = [np.empty(0)]
+    best_rosters = [np.empty((0, roster_size), dtype=np.int64)]
+    for allocation in sorted(allocations):
+        sums, rosters = np.zeros(1), np.empty((1, 0), dtype=np.int64)
+        for pos, n in zip(positions, allocation):
+            if not n:
+                continue
+            if (pos, n) not in subsets:
+                idx = candidates[pos]
+                sub_sums, sub_members = _top_subsets(players.proj_mean[idx], n, k)
+                subsets[pos, n] = (sub_sums, idx[sub_members])
+            sub_sums, sub_rosters = subsets[pos, n]
+            if not len(sub_sums):
+                sums, rosters = sub_sums, np.empty((0, roster_size), dtype=np.int64)
+                break
+            # Top k of pairwise sums only needs the top k of each side
+            pair_sums = (sums[:, None] + sub_sums[None, :]).ravel()
+            keep = _top_k(pair_sums, k)
+            left, right = np.divmod(keep, len(sub_sums))
+            sums = pair_sums[keep]
+            rosters = np.concatenate([rosters[left], sub_rosters[right]], axis=1)
+        best_sums.append(sums)
+        best_rosters.append(rosters)
+    sums = np.concatenate(best_sums)
+    rosters = np.concatenate(best_rosters)
+    return RosterBatch(players, rosters[_top_k(sums, k)])
@@ -0,0 +1,220 @@
+"""
+Parallel simulation engine backed by shared memory and a persistent worker pool.
+"""
+import atexit
+import multiprocessing as mp
+import pickle
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from .profiling import NULL_PROFILER
+
+CHUNK_SIZE = 64
+
+_POOL = None
+_POOL_PROCESSES = None
+# Worker-side cache of attached shared memory blocks, keyed by block name
+_ATTACHED = {}
+
+
+def get_pool(processes=None):
+    """
+    Return the persistent worker pool, starting it on first use.
+
+    Args:
+        processes (int, optional): Number of workers; defaults to the CPU count.
+
+    Returns:
+        multiprocessing.pool.Pool: Worker pool reused across calls.
+    """
+    global _POOL, _POOL_PROCESSES
+    processes = processes or mp.cpu_count()
+    if _POOL is not None and _POOL_PROCESSES != processes:
+        shutdown_pool()
+    if _POOL is None:
+        if sys.platform != "win32":
+            # Workers must share the parent's tracker; a tracker of their own
+            # would unlink attached blocks when the worker exits
+            resource_tracker.ensure_running()
+        _POOL = mp.Pool(processes)
+        _POOL_PROCESSES = processes
+    return _POOL
+
+
+def shutdown_pool():
+    """
+    Stop the persistent worker pool.
+    """
+    global _POOL, _POOL_PROCESSES
+    if _POOL is not None:
+        _POOL.close()
+        _POOL.join()
+        _POOL = None
+        _POOL_PROCESSES = None
+
+
+atexit.register(shutdown_pool)
+
+
+class SharedArrays:
+    """
+    Copy NumPy arrays into shared memory for the lifetime of a with block.
+
+    Args:
+        arrays (dict): Arrays to share, by name.
+        outputs (dict, optional): (shape, dtype) of zero-filled arrays workers write to.
+    """
+    def __init__(self, arrays, outputs=None):
+        self.blocks = []
+        self.spec = {}
+        self.arrays = {}
+        for key, array in arrays.items():
+            self._share(key, array.shape, array.dtype)[...] = array
+        for key, (shape, dtype) in (outputs or {}).items():
+            self._share(key, shape, dtype)[...] = 0
+
+    def _share(self, key, shape, dtype):
+        dtype = np.dtype(dtype)
+        block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        self.blocks.append(block)
+        self.spec[key] = (block.name, shape, dtype.str)
+        self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        return self.arrays[key]
+
+    @property
+    def nbytes(self):
+        """Total size of the shared blocks in bytes."""
+        return sum(block.size for block in self.blocks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.arrays.clear()
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+
+def _open_block(name):
+    """
+    Attach to a block created by the parent.
+
+    Args:
+        name (str): Block name.
+
+    Returns:
+        shared_memory.SharedMemory: Attached block.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Registers with the parent's resource tracker (see get_pool), where the
+    # name is already tracked, so the worker never unlinks the block on exit
+    return shared_memory.SharedMemory(name=name)
+
+
+def _attach(spec):
+    """
+    Map the shared arrays described by spec inside a worker.
+
+    Args:
+        spec (dict): Block name, shape and dtype per array, from SharedArrays.spec.
+
+    Returns:
+        dict: NumPy views of the shared arrays.
+    """
+    names = {name for name, _, _ in spec.values()}
+    for stale in set(_ATTACHED) - names:
+        _ATTACHED.pop(stale).close()
+    arrays = {}
+    for key, (name, shape, dtype) in spec.items():
+        if name not in _ATTACHED:
+            _ATTACHED[name] = _open_block(name)
+        arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_ATTACHED[name].buf)
+    return arrays
+
+
+def simulate_chunk(means, sds, index, out, seed, weeks):
+    """
+    Simulate season totals for a chunk of rosters with independent weekly normals.
+
+    Args:
+        means (np.ndarray): Weekly projected mean for every player.
+        sds (np.ndarray): Weekly projected standard deviation for every player.
+        index (np.ndarray): (n_rosters, roster_size) player indices for the chunk.
+        out (np.ndarray): (n_rosters, simulations) array receiving season totals.
+        seed (np.random.SeedSequence): Seed for this chunk's generator.
+        weeks (int): Number of weeks in the season.
+    """
+    rng = np.random.default_rng(seed)
+    for row, roster in enumerate(index):
+        scores = rng.normal(
+            loc=means[roster][None, None, :],
+            scale=sds[roster][None, None, :],
+            size=(out.shape[1], weeks, len(roster))
+        )
+        out[row] = scores.sum(axis=2).sum(axis=1)
+
+
+def _run_task(task):
+    """
+    Worker entry point: simulate one chunk of rosters in shared memory.
+
+    Args:
+        task (tuple): (spec, start, stop, seed, weeks).
+    """
+    spec, start, stop, seed, weeks = task
+    arrays = _attach(spec)
+    simulate_chunk(arrays["proj_mean"], arrays["proj_sd"], arrays["index"][start:stop],
+                   arrays["scores"][start:stop], seed, weeks)
+
+
+def simulate_parallel(rosters, weeks, simulations, seed_sequence, use_multiprocessing=True,
+                      processes=None, chunk_size=CHUNK_SIZE, profiler=None):
+    """
+    Simulate season totals for every roster in a batch.
+
+    Rosters are split into fixed-size chunks and each chunk draws from its own
+    generator spawned from seed_sequence, so results depend only on the seed and
+    chunk_size, not on the number of workers or whether a pool is used at all.
+
+    Args:
+        rosters (RosterBatch): Rosters to simulate.
+        weeks (int): Number of weeks in the season.
+        simulations (int): Number of seasons per roster.
+        seed_sequence (np.random.SeedSequence): Parent seed; one child is spawned per chunk.
+        use_multiprocessing (bool): Run chunks on the persistent worker pool.
+        processes (int, optional): Number of workers.
+        chunk_size (int): Rosters per task.
+        profiler (Profiler, optional): Receives draw and transfer counters and
+            per-chunk progress.
+
+    Returns:
+        np.ndarray: (n_rosters, simulations) season totals.
+    """
+    profiler = profiler if profiler is not None else NULL_PROFILER
+    players = rosters.players
+    profiler.count("draws", rosters.index.size * weeks * simulations)
+    bounds = [(start, min(start + chunk_size, len(rosters))) for start in range(0, len(rosters), chunk_size)]
+    seeds = seed_sequence.spawn(len(bounds))
+    if not use_multiprocessing or len(bounds) < 2:
+        scores = np.empty((len(rosters), simulations))
+        for done, ((start, stop), seed) in enumerate(zip(bounds, seeds), 1):
+            simulate_chunk(players.proj_mean, players.proj_sd, rosters.index[start:stop],
+                           scores[start:stop], seed, weeks)
+            profiler.progress("simulate", done, len(bounds))
+        return scores
+    arrays = {"proj_mean": players.proj_mean, "proj_sd": players.proj_sd, "index": rosters.index}
+    with SharedArrays(arrays, outputs={"scores": ((len(rosters), simulations), np.float64)}) as shared:
+        tasks = [(shared.spec, start, stop, seed, weeks) for (start, stop), seed in zip(bounds, seeds)]
+        if profiler.enabled:
+            # Shared blocks are written once; each task pickles only its spec and seed
+            profiler.count("bytes_to_workers", shared.nbytes + sum(len(pickle.dumps(task)) for task in tasks))
+        with profiler.stage("workers"):
+            # Chunks write to shared memory, so completion order does not matter
+            for done, _ in enumerate(get_pool(processes).imap_unordered(_run_task, tasks), 1):
+                profiler.progress("simulate", done, len(tasks))
+        return shared.arrays["scores"].copy()
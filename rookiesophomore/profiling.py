@@ -0,0 +1,178 @@
+"""
+Stage timers, counters and progress callbacks for the simulation pipeline.
+"""
+import json
+import os
+import time
+
+# Formats Profiler.write accepts
+PROFILE_FORMATS = ("json", "chrome", "text")
+
+
+class _Stage:
+    """
+    Timing context for one stage of a Profiler.
+
+    Args:
+        profiler (Profiler): Profiler receiving the timing.
+        name (str): Stage name.
+    """
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.name, self.start, time.perf_counter() - self.start)
+
+
+class _NullStage:
+    """Do-nothing stage handed out by disabled profilers."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Profiler:
+    """
+    Collects per-stage wall times and named counters.
+
+    Stages may nest; each stage's time includes its nested stages. A disabled
+    profiler hands out a shared no-op stage and ignores counters, so
+    instrumentation costs one attribute check when profiling is off.
+
+    Args:
+        enabled (bool): Record timings and counters.
+        progress (Callable[[str, int, int], None], optional): Called as
+            progress(stage, done, total) while long stages advance, whether or not
+            timings are recorded.
+    """
+    def __init__(self, enabled=True, progress=None):
+        self.enabled = enabled
+        self.callback = progress
+        self.totals = {}
+        self.counters = {}
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def stage(self, name):
+        """
+        Time a block of work.
+
+        Args:
+            name (str): Stage name; repeated stages accumulate.
+
+        Returns:
+            Context manager timing the block.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def _record(self, name, start, seconds):
+        total = self.totals.setdefault(name, [0.0, 0])
+        total[0] += seconds
+        total[1] += 1
+        self.events.append((name, start - self.origin, seconds))
+
+    def count(self, name, value=1):
+        """
+        Add to a named counter.
+
+        Args:
+            name (str): Counter name.
+            value (int): Amount to add.
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def progress(self, stage, done, total):
+        """
+        Report progress of a stage to the progress callback.
+
+        Args:
+            stage (str): Stage name.
+            done (int): Units of work finished.
+            total (int): Units of work in the stage.
+        """
+        if self.callback is not None:
+            self.callback(stage, done, total)
+
+    def report(self):
+        """
+        Stage timings and counters.
+
+        Returns:
+            dict: "stages" mapping each stage to its seconds and calls, and "counters".
+        """
+        return {
+            "stages": {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in self.totals.items()},
+            "counters": dict(self.counters)
+        }
+
+    def format(self):
+        """
+        Human-readable stage breakdown.
+
+        Returns:
+            str: One line per stage in order of first use, then one per counter.
+        """
+        lines = [f"{'stage':<24}{'seconds':>10}{'calls':>8}"]
+        for name, (seconds, calls) in self.totals.items():
+            lines.append(f"{name:<24}{seconds:>10.4f}{calls:>8}")
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'counter':<24}{'value':>18}")
+            for name, value in self.counters.items():
+                lines.append(f"{name:<24}{value:>18,}")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """
+        Stage events in the Chrome trace event format (chrome://tracing, Perfetto).
+
+        Returns:
+            dict: Trace with one complete event per stage call and the final counters.
+        """
+        pid = os.getpid()
+        events = [
+            {"name": name, "ph": "X", "ts": start * 1e6, "dur": seconds * 1e6, "pid": pid, "tid": 0}
+            for name, start, seconds in self.events
+        ]
+        end = max((start + seconds for _, start, seconds in self.events), default=0.0)
+        events.extend(
+            {"name": name, "ph": "C", "ts": end * 1e6, "pid": pid, "args": {name: value}}
+            for name, value in self.counters.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path, format="json"):
+        """
+        Write the profile to a file.
+
+        Args:
+            path (str): Destination file.
+            format (str): "json" for report(), "chrome" for chrome_trace(), "text" for format().
+        """
+        if format not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format: {format}")
+        with open(path, "w") as f:
+            if format == "text":
+                f.write(self.format() + "\n")
+            else:
+                json.dump(self.report() if format == "json" else self.chrome_trace(), f, indent=2)
+
+
+NULL_PROFILER = Profiler(enabled=False)
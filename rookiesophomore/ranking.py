@@ -1,9 +1,13 @@
 """
 Ranking module for rookie and sophomore fantasy football players.
 """
+from typing import Dict, Optional, Sequence, Tuple
+
 import pandas as pd
 import numpy as np
 
+from .cache import ResultCache, cache_key, pack_frame, unpack_frame
+
 POSITION_LIMITS = {
     'QB': 1,
     'RB': 2,
@@ -43,21 +47,121 @@ def select_bench(df: pd.DataFrame, starters: pd.DataFrame, bench_size: int) -> p
 def assign_tiers(df: pd.DataFrame, score_column: str = 'risk_adjusted_score', threshold: float = 2.0) -> pd.DataFrame:
     df = df.sort_values(by=score_column, ascending=False).copy()
     scores = df[score_column].values
-    tiers = [1]
-    for i in range(1, len(scores)):
-        if scores[i - 1] - scores[i] > threshold:
-            tiers.append(tiers[-1] + 1)
-        else:
-            tiers.append(tiers[-1])
-    df['tier'] = tiers
+    # A new tier starts wherever the drop from the previous score exceeds the threshold
+    df['tier'] = 1 + np.cumsum(np.diff(scores, prepend=scores[:1]) < -threshold)
     return df
 
+def tier_numbers(scores: np.ndarray, threshold: float = 2.0) -> np.ndarray:
+    """Tiers for rows of descending scores, as assign_tiers computes them per row."""
+    drops = np.diff(scores, axis=-1) < -threshold
+    return 1 + np.concatenate([np.zeros(scores.shape[:-1] + (1,), dtype=np.int64), np.cumsum(drops, axis=-1)], axis=-1)
+
+def descending_ranks(scores: np.ndarray) -> np.ndarray:
+    """Average ranks (1 = best) for rows of descending scores, as Series.rank(ascending=False)."""
+    n = scores.shape[-1]
+    positions = np.broadcast_to(np.arange(n), scores.shape)
+    starts = np.ones(scores.shape, dtype=bool)
+    starts[..., 1:] = scores[..., 1:] != scores[..., :-1]
+    ends = np.ones(scores.shape, dtype=bool)
+    ends[..., :-1] = starts[..., 1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=-1)
+    last = np.minimum.accumulate(np.where(ends, positions, n)[..., ::-1], axis=-1)[..., ::-1]
+    return (first + last) / 2 + 1
+
+def select_roster_grid(positions: np.ndarray, scores: np.ndarray,
+                       limits: dict, bench_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    select_starters and select_bench for many score vectors at once.
+
+    Returns (order, role) where order is each row's players sorted by descending
+    score, truncated to the roster, and role is 0 for starters and 1 for bench.
+    """
+    order = np.argsort(-scores, axis=1, kind='stable')
+    ranked = positions[order]
+    starter = np.zeros(order.shape, dtype=bool)
+    for pos in ['QB', 'RB', 'WR', 'TE']:
+        at_pos = ranked == pos
+        starter |= at_pos & (np.cumsum(at_pos, axis=1) <= limits[pos])
+    superflex_pool = np.isin(ranked, ['QB', 'RB', 'WR', 'TE']) & ~starter
+    starter |= superflex_pool & (np.cumsum(superflex_pool, axis=1) <= limits['SUPERFLEX'])
+    bench = ~starter & (np.cumsum(~starter, axis=1) <= bench_size)
+    # Roster sizes depend only on position counts, so every row keeps the same number of players
+    keep = starter | bench
+    size = keep[0].sum() if len(keep) else 0
+    columns = np.argsort(~keep, axis=1, kind='stable')[:, :size]
+    return np.take_along_axis(order, columns, axis=1), np.take_along_axis(bench, columns, axis=1).astype(np.int8)
+
+def rank_grid(df: pd.DataFrame,
+              lambdas: Sequence[float],
+              position_limits: dict = POSITION_LIMITS,
+              bench_size: int = BENCH_SIZE,
+              threshold: float = 2.0) -> pd.DataFrame:
+    """Long-format build_roster output for every lambda over already loaded data."""
+    eligible = filter_eligible_players(df)
+    lambdas = np.asarray(lambdas, dtype=np.float64)
+    std_dev = ((eligible['ceiling_projection'] - eligible['floor_projection']) / 4).to_numpy(dtype=np.float64)
+    mean = eligible['mean_projection'].to_numpy(dtype=np.float64)
+    # One broadcast scores every player under every risk level
+    scores = mean[None, :] - lambdas[:, None] * std_dev[None, :]
+    order, bench = select_roster_grid(eligible['position'].to_numpy(), scores, position_limits, bench_size)
+    picked = np.take_along_axis(scores, order, axis=1)
+    size = order.shape[1]
+    roster = eligible.iloc[order.ravel()].copy()
+    roster.insert(0, 'lambda_risk', np.repeat(lambdas, size))
+    roster['std_dev'] = std_dev[order.ravel()]
+    roster['risk_adjusted_score'] = picked.ravel()
+    roster['role'] = np.where(bench.ravel() == 1, 'bench', 'starter')
+    roster['final_rank'] = descending_ranks(picked).ravel()
+    roster['tier'] = tier_numbers(picked, threshold).ravel()
+    return roster
+
+def build_roster_grid(filepath: str,
+                      lambdas: Sequence[float],
+                      position_limits: dict = POSITION_LIMITS,
+                      bench_size: int = BENCH_SIZE) -> pd.DataFrame:
+    return rank_grid(load_data(filepath), lambdas, position_limits, bench_size)
+
+def build_roster_batch(filepaths: Sequence[str],
+                       lambdas: Sequence[float],
+                       formats: Optional[Dict[str, dict]] = None,
+                       bench_size: int = BENCH_SIZE) -> pd.DataFrame:
+    """
+    Sweep risk levels for several files and league formats in one long-format frame.
+
+    formats maps a format name to its position limits; each file is read once.
+    """
+    formats = formats or {'default': POSITION_LIMITS}
+    frames = []
+    for filepath in filepaths:
+        df = load_data(filepath)
+        for name, limits in formats.items():
+            grid = rank_grid(df, lambdas, limits, bench_size)
+            grid.insert(0, 'format', name)
+            grid.insert(0, 'source', filepath)
+            frames.append(grid)
+    return pd.concat(frames)
+
 def build_roster(filepath: str,
                  position_limits: dict = POSITION_LIMITS,
                  bench_size: int = BENCH_SIZE,
-                 lambda_risk: float = RISK_AVERSION) -> pd.DataFrame:
+                 lambda_risk: float = RISK_AVERSION,
+                 cache: Optional[ResultCache] = None) -> pd.DataFrame:
+    if cache is not None:
+        with open(filepath, 'rb') as f:
+            key = cache_key('build_roster', f.read(), position_limits, bench_size, lambda_risk)
+        cached = cache.get(key)
+        if cached is not None:
+            return unpack_frame(cached)
+        roster = build_roster(filepath, position_limits, bench_size, lambda_risk)
+        cache.put(key, pack_frame(roster))
+        return roster
     df = load_data(filepath)
-    eligible = filter_eligible_players(df)
+    return rank_players(filter_eligible_players(df), position_limits, bench_size, lambda_risk)
+
+def rank_players(eligible: pd.DataFrame,
+                 position_limits: dict = POSITION_LIMITS,
+                 bench_size: int = BENCH_SIZE,
+                 lambda_risk: float = RISK_AVERSION) -> pd.DataFrame:
     scored = calculate_risk_adjusted_score(eligible, lambda_risk)
     starters = select_starters(scored, position_limits)
     bench = select_bench(scored, starters, bench_size)
@@ -0,0 +1,241 @@
+"""
+Columnar on-disk results: write simulation results once, memory-map them for reporting.
+
+A results directory holds one .npy file per column so any column can be read
+without touching the others:
+
+    meta.json            format version, columns and simulation settings
+    index.npy            (n_rosters, roster_size) int32 player positions
+    <column>.npy         (n_rosters,) float32 summaries such as average_score
+    distributions.npy    (n_kept, simulations) float32 season totals (optional)
+    distribution_rows.npy  roster rows that distributions.npy covers
+    players.npz          name, team, position, proj_mean and proj_sd of the pool
+"""
+import json
+import os
+
+import numpy as np
+
+from .stats import QUANTILES
+from .tables import PlayerTable
+
+FORMAT_VERSION = 1
+SUMMARY_COLUMNS = ("average_score", "std", "p10", "p50", "p90")
+
+
+def write_results(path, results, players, keep_distributions=True, **meta):
+    """
+    Write run_simulation results to a columnar results directory.
+
+    Summaries missing from the results (std and quantiles of full-distribution
+    runs) are computed from the distributions.
+
+    Args:
+        path (str): Directory to write; created if missing.
+        results (List[dict]): Simulation results with "roster" index rows.
+        players (PlayerTable): Player pool the rosters index into.
+        keep_distributions (bool): Also write score distributions where results have them.
+        **meta: Extra settings (e.g. weeks, simulations) recorded in meta.json.
+    """
+    os.makedirs(path, exist_ok=True)
+    n = len(results)
+    np.save(os.path.join(path, "index.npy"), np.array([r["roster"] for r in results], dtype=np.int32))
+
+    rows = np.array([i for i, r in enumerate(results) if "score_distribution" in r], dtype=np.int64)
+    simulations = len(results[rows[0]]["score_distribution"]) if len(rows) else 0
+    distributions = None
+    if len(rows):
+        shape = (len(rows), simulations)
+        if keep_distributions:
+            distributions = np.lib.format.open_memmap(os.path.join(path, "distributions.npy"), mode="w+",
+                                                      dtype=np.float32, shape=shape)
+            np.save(os.path.join(path, "distribution_rows.npy"), rows)
+        else:
+            distributions = np.empty(shape, dtype=np.float32)
+        # Fill row by row so a full float64 matrix never exists in memory
+        for j, i in enumerate(rows):
+            distributions[j] = results[i]["score_distribution"]
+
+    for column in SUMMARY_COLUMNS:
+        values = np.full(n, np.nan, dtype=np.float32)
+        have = [i for i, r in enumerate(results) if column in r]
+        values[have] = [results[i][column] for i in have]
+        missing = np.isnan(values[rows])
+        if missing.any():
+            values[rows[missing]] = _summarize(distributions[missing], column)
+        np.save(os.path.join(path, f"{column}.npy"), values)
+
+    np.savez(
+        os.path.join(path, "players.npz"),
+        name=players.name.astype(str),
+        team=players.team.astype(str),
+        position=players.position.astype(str),
+        proj_mean=players.proj_mean,
+        proj_sd=players.proj_sd
+    )
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump({"version": FORMAT_VERSION, "n_rosters": n, "columns": list(SUMMARY_COLUMNS), **meta}, f)
+    if isinstance(distributions, np.memmap):
+        distributions.flush()
+
+
+def _summarize(distributions, column):
+    """
+    One summary column from score distributions.
+
+    Args:
+        distributions (np.ndarray): (n, simulations) season totals.
+        column (str): Name from SUMMARY_COLUMNS.
+
+    Returns:
+        np.ndarray: (n,) summary values.
+    """
+    if column == "average_score":
+        return distributions.mean(axis=1, dtype=np.float64)
+    if column == "std":
+        return distributions.std(axis=1, ddof=1, dtype=np.float64)
+    level = dict(zip(("p10", "p50", "p90"), QUANTILES))[column]
+    return np.quantile(distributions, level, axis=1)
+
+
+class ResultsFile:
+    """
+    Memory-mapped view of a results directory written by write_results.
+
+    Opening reads only meta.json and the small player table; columns and
+    distributions are mapped and paged in on access.
+
+    Args:
+        path (str): Results directory.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported results format version: {self.meta.get('version')}")
+        self.index = self._load("index.npy")
+        with np.load(os.path.join(path, "players.npz")) as data:
+            self.players = PlayerTable(data["name"], data["position"], data["proj_mean"], data["proj_sd"],
+                                       team=data["team"])
+        self._columns = {}
+
+    def _load(self, name):
+        return np.load(os.path.join(self.path, name), mmap_mode="r")
+
+    def __len__(self):
+        return self.meta["n_rosters"]
+
+    @property
+    def columns(self):
+        return self.meta["columns"]
+
+    def column(self, name):
+        """
+        Memory-mapped summary column.
+
+        Args:
+            name (str): Column name, e.g. "average_score" or "p90".
+
+        Returns:
+            np.memmap: (n_rosters,) float32 values.
+        """
+        if name not in self.columns:
+            raise KeyError(f"Unknown column: {name}")
+        if name not in self._columns:
+            self._columns[name] = self._load(f"{name}.npy")
+        return self._columns[name]
+
+    @property
+    def has_distributions(self):
+        return os.path.exists(os.path.join(self.path, "distributions.npy"))
+
+    def distribution(self, row):
+        """
+        Score distribution of one roster.
+
+        Args:
+            row (int): Roster row.
+
+        Returns:
+            np.ndarray or None: Season totals, or None when the row was not kept.
+        """
+        if not self.has_distributions:
+            return None
+        rows = self._load("distribution_rows.npy")
+        j = np.searchsorted(rows, row)
+        if j == len(rows) or rows[j] != row:
+            return None
+        return self._load("distributions.npy")[j]
+
+    def top(self, n=10, by="average_score", ascending=False, where=None):
+        """
+        Rows of the best rosters by a summary column.
+
+        Args:
+            n (int): Number of rows.
+            by (str): Column to sort by.
+            ascending (bool): Smallest values first instead of largest.
+            where (np.ndarray, optional): Boolean mask of eligible rows.
+
+        Returns:
+            np.ndarray: Up to n roster rows in sorted order.
+        """
+        values = np.asarray(self.column(by), dtype=np.float64)
+        key = values if ascending else -values
+        key = np.where(np.isnan(key), np.inf, key)
+        if where is not None:
+            key = np.where(where, key, np.inf)
+        n = min(n, int(np.isfinite(key).sum()))
+        if n <= 0:
+            return np.zeros(0, dtype=np.int64)
+        # Partial selection first so sorting touches only n rows
+        candidates = np.argpartition(key, n - 1)[:n]
+        return candidates[np.argsort(key[candidates], kind="stable")]
+
+    def containing(self, name):
+        """
+        Mask of rosters holding a player.
+
+        Args:
+            name (str): Player name.
+
+        Returns:
+            np.ndarray: (n_rosters,) boolean mask.
+        """
+        positions = np.flatnonzero(self.players.name == name)
+        return np.isin(self.index, positions).any(axis=1)
+
+    def names(self, row):
+        """
+        Player names of one roster.
+
+        Args:
+            row (int): Roster row.
+
+        Returns:
+            List[str]: Names of the rostered players.
+        """
+        return self.players.name[self.index[row]].tolist()
+
+    def plot(self, row, save=None):
+        """
+        Histogram of one roster's score distribution.
+
+        Args:
+            row (int): Roster row.
+            save (str, optional): File to save the plot to; shows it when omitted.
+        """
+        import matplotlib.pyplot as plt
+        values = self.distribution(row)
+        if values is None:
+            raise ValueError(f"No score distribution stored for roster {row}.")
+        plt.hist(values, bins=30, alpha=0.7)
+        plt.title("Score Distribution for Top Roster")
+        plt.xlabel("Season Points")
+        plt.ylabel("Frequency")
+        plt.grid(True)
+        if save:
+            plt.savefig(save)
+        else:
+            plt.show()
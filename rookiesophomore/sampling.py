@@ -0,0 +1,90 @@
+"""
+Vectorized roster sampling.
+"""
+import warnings
+
+import numpy as np
+
+from .profiling import NULL_PROFILER
+from .tables import RosterBatch
+
+
+def _draw_rosters(positions, groups, n_rosters, rng):
+    """
+    Draw rosters by filling slot groups in order, skipping players already taken.
+
+    Args:
+        positions (np.ndarray): Position of each player in the pool.
+        groups (List[Tuple[int, List[str]]]): (count, eligible positions) per slot group.
+        n_rosters (int): Number of rosters to draw.
+        rng (np.random.Generator): Random generator.
+
+    Returns:
+        np.ndarray: (n_valid, roster_size) player indices; rows that ran out of
+        eligible players are dropped.
+    """
+    n_players = len(positions)
+    available = np.ones((n_rosters, n_players), dtype=bool)
+    valid = np.ones(n_rosters, dtype=bool)
+    picks = []
+    for count, eligible in groups:
+        # Random keys give a uniform subset; ineligible or taken players sort last
+        keys = np.where(available & np.isin(positions, eligible), rng.random((n_rosters, n_players)), -1.0)
+        chosen = np.argpartition(-keys, count - 1, axis=1)[:, :count]
+        valid &= (np.take_along_axis(keys, chosen, axis=1) >= 0).all(axis=1)
+        np.put_along_axis(available, chosen, False, axis=1)
+        picks.append(chosen)
+    return np.concatenate(picks, axis=1)[valid]
+
+
+def sample_rosters(players, requirements, n_rosters, rng=None, oversample=1.5, patience=3, profiler=None):
+    """
+    Sample unique valid rosters from a player pool.
+
+    Slots are filled in the order given by requirements.slot_groups(), so FLEX,
+    SUPERFLEX and BENCH picks never collide with an earlier slot. Rosters containing the same
+    players in a different slot order count as duplicates and are kept once.
+
+    Args:
+        players (PlayerTable): Player pool.
+        requirements (RosterRequirements): Roster requirements.
+        n_rosters (int): Number of unique rosters to return.
+        rng (np.random.Generator, optional): Random generator.
+        oversample (float): Extra draws per missing roster in each round.
+        patience (int): Rounds without a new roster before the pool counts as exhausted.
+        profiler (Profiler, optional): Receives sampling and duplicate-rejection
+            timings and roster counters.
+
+    Returns:
+        RosterBatch: Exactly n_rosters unique rosters, or every roster found with a
+        warning when the pool is exhausted.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    profiler = profiler if profiler is not None else NULL_PROFILER
+    groups = [(count, eligible) for _, count, eligible in requirements.slot_groups(include_bench=True) if count > 0]
+    roster_size = sum(count for count, _ in groups)
+    if roster_size > len(players):
+        raise ValueError("Player pool cannot fill the roster requirements.")
+    rosters = np.empty((0, roster_size), dtype=np.int32)
+    stalled = 0
+    while len(rosters) < n_rosters and stalled < patience:
+        needed = n_rosters - len(rosters)
+        requested = max(int(needed * oversample), 64)
+        with profiler.stage("sample"):
+            drawn = _draw_rosters(players.position, groups, requested, rng)
+        with profiler.stage("dedupe"):
+            combined = np.concatenate([rosters, drawn.astype(np.int32)])
+            # Keep the first occurrence of each player set, preserving draw order
+            _, first = np.unique(np.sort(combined, axis=1), axis=0, return_index=True)
+            unique = combined[np.sort(first)]
+        profiler.count("rosters_requested", requested)
+        profiler.count("rosters_valid", len(drawn))
+        profiler.count("rosters_accepted", len(unique) - len(rosters))
+        stalled = stalled + 1 if len(unique) == len(rosters) else 0
+        rosters = unique
+        profiler.progress("sample_rosters", min(len(rosters), n_rosters), n_rosters)
+    if not len(rosters):
+        raise ValueError("Player pool cannot fill the roster requirements.")
+    if len(rosters) < n_rosters:
+        warnings.warn(f"Player pool exhausted: found {len(rosters)} of {n_rosters} requested unique rosters.")
+    return RosterBatch(players, rosters[:n_rosters])
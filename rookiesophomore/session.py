@@ -0,0 +1,208 @@
+"""
+Persistent simulation sessions that re-score rosters incrementally when projections change.
+"""
+import numpy as np
+
+from .tables import PlayerTable, RosterBatch
+
+
+class SimulationSession:
+    """
+    Cached simulation of a fixed set of starter-only rosters.
+
+    A player's simulated season total is weeks * proj_mean + proj_sd * S, where S
+    is the sum of the player's standardized weekly draws. The session keeps S per
+    player and the season totals per roster, so changing one player's projection
+    only adds that player's change in contribution to the rosters that hold them.
+
+    Args:
+        players (PlayerTable): Player pool; the session owns its projection arrays.
+        index (np.ndarray): (n_rosters, roster_size) player positions per roster.
+        standardized (np.ndarray): (simulations, n_used) standardized season sums of
+            the players in used.
+        used (np.ndarray): Positions in players of the rostered players, in the
+            column order of standardized.
+        weeks (int): Number of weeks in the season.
+        totals (np.ndarray, optional): (n_rosters, simulations) season totals;
+            computed from the other arguments when omitted.
+    """
+    def __init__(self, players, index, standardized, used, weeks, totals=None):
+        self.players = PlayerTable(
+            players.name, players.position, players.proj_mean.copy(), players.proj_sd.copy(), team=players.team
+        )
+        self.index = np.ascontiguousarray(index, dtype=np.int32)
+        self.standardized = standardized
+        self.used = np.asarray(used, dtype=np.int64)
+        self.weeks = weeks
+        self.column = np.full(len(self.players), -1, dtype=np.int64)
+        self.column[self.used] = np.arange(len(self.used))
+        if totals is None:
+            seasons = (self.weeks * self.players.proj_mean[self.used]
+                       + self.players.proj_sd[self.used] * self.standardized)
+            totals = seasons.T[self.column[self.index]].sum(axis=1)
+        self.totals = totals
+        self.means = totals.mean(axis=1)
+        self.order = np.argsort(-self.means, kind="stable")
+
+    @classmethod
+    def start(cls, simulator, rosters):
+        """
+        Simulate rosters once and cache the draws needed for later updates.
+
+        Args:
+            simulator (RosterSimulator): Supplies the draw machinery, weeks and simulations.
+            rosters (RosterBatch): Starter-only rosters to track.
+
+        Returns:
+            SimulationSession: Session over the simulated rosters.
+        """
+        starters = sum(count for _, count, _ in simulator.requirements.slot_groups())
+        if rosters.roster_size > starters:
+            raise ValueError("Sessions support starter-only rosters; weekly lineup choices are not additive.")
+        used = np.unique(rosters.index)
+        rng = np.random.default_rng(simulator.seed_sequence.spawn(1)[0])
+        # Zero means and unit deviations leave the standardized weekly draws to sum
+        standardized = simulator.draw_player_seasons(
+            np.zeros(len(used)), np.ones(len(used)), rng=rng, players=used
+        )
+        return cls(rosters.players, rosters.index, standardized, used, simulator.weeks)
+
+    @property
+    def rosters(self):
+        """RosterBatch over the session's player pool."""
+        return RosterBatch(self.players, self.index)
+
+    @property
+    def simulations(self):
+        return self.standardized.shape[0]
+
+    def _position(self, player):
+        """
+        Position of a player in the pool.
+
+        Args:
+            player (int or str): Position in the pool or player name.
+
+        Returns:
+            int: Position in the pool.
+        """
+        if isinstance(player, (int, np.integer)):
+            return int(player)
+        matches = np.flatnonzero(self.players.name == player)
+        if not len(matches):
+            raise KeyError(f"Unknown player: {player}")
+        return int(matches[0])
+
+    def update(self, player, proj_mean=None, proj_sd=None):
+        """
+        Change one player's projection and re-score the rosters that hold them.
+
+        Args:
+            player (int or str): Position in the pool or player name.
+            proj_mean (float, optional): New weekly projected mean.
+            proj_sd (float, optional): New weekly projected standard deviation.
+
+        Returns:
+            np.ndarray: Rows of the rosters whose scores changed.
+        """
+        i = self._position(player)
+        old_mean, old_sd = self.players.proj_mean[i], self.players.proj_sd[i]
+        new_mean = old_mean if proj_mean is None else proj_mean
+        new_sd = old_sd if proj_sd is None else proj_sd
+        self.players.proj_mean[i] = new_mean
+        self.players.proj_sd[i] = new_sd
+        copies = (self.index == i).sum(axis=1)
+        affected = np.flatnonzero(copies)
+        if not len(affected) or (new_mean == old_mean and new_sd == old_sd):
+            return affected[:0]
+
+        delta = self.weeks * (new_mean - old_mean) + (new_sd - old_sd) * self.standardized[:, self.column[i]]
+        self.totals[affected] += copies[affected, None] * delta
+        self.means[affected] += copies[affected] * delta.mean()
+        self.order = np.argsort(-self.means, kind="stable")
+        return affected
+
+    def update_pool(self, player_pool):
+        """
+        Apply every projection that differs in a new version of the player pool.
+
+        Players are matched by name; players missing from either side are ignored.
+
+        Args:
+            player_pool (pd.DataFrame, list or PlayerTable): Updated player pool.
+
+        Returns:
+            List[str]: Names of the players whose projections changed.
+        """
+        updated = PlayerTable.from_pool(player_pool)
+        lookup = {name: i for i, name in enumerate(updated.name)}
+        changed = []
+        for i, name in enumerate(self.players.name):
+            j = lookup.get(name)
+            if j is None:
+                continue
+            mean, sd = updated.proj_mean[j], updated.proj_sd[j]
+            if mean != self.players.proj_mean[i] or sd != self.players.proj_sd[i]:
+                self.update(i, proj_mean=mean, proj_sd=sd)
+                changed.append(name)
+        return changed
+
+    def results(self, top_n=None):
+        """
+        Rosters ranked by average season score.
+
+        Args:
+            top_n (int, optional): Only the best top_n rosters.
+
+        Returns:
+            List[dict]: Player indices, average score and score distribution per
+            roster, best first.
+        """
+        return [
+            {
+                "roster": self.index[row],
+                "average_score": self.means[row],
+                "score_distribution": self.totals[row].tolist()
+            }
+            for row in self.order[:top_n]
+        ]
+
+    def save(self, path):
+        """
+        Write the session to an .npz file.
+
+        Args:
+            path (str): Destination file.
+        """
+        # Write through a file handle so the exact path is kept, with or without .npz
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                name=self.players.name.astype(str),
+                position=self.players.position.astype(str),
+                team=self.players.team.astype(str),
+                proj_mean=self.players.proj_mean,
+                proj_sd=self.players.proj_sd,
+                index=self.index,
+                standardized=self.standardized,
+                used=self.used,
+                weeks=self.weeks,
+                totals=self.totals
+            )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a session written by save.
+
+        Args:
+            path (str): Session file.
+
+        Returns:
+            SimulationSession: Restored session.
+        """
+        with np.load(path) as data:
+            players = PlayerTable(data["name"], data["position"], data["proj_mean"], data["proj_sd"],
+                                  team=data["team"])
+            return cls(players, data["index"], data["standardized"], data["used"], int(data["weeks"]),
+                       totals=data["totals"])
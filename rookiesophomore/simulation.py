@@ -11,13 +11,14 @@ class RosterRequirements:
         DST (int): Number of defenses/special teams.
         FLEX (int): Number of flex spots.
         SUPERFLEX (int): Number of superflex spots.
+        BENCH (int): Number of bench spots, eligible for any position.
         flex_positions (List[str], optional): Eligible positions for flex.
         superflex_positions (List[str], optional): Eligible positions for superflex.
     """
     def __init__(
         self,
         QB=1, RB=2, WR=2, TE=1, K=0, DST=0, FLEX=1, SUPERFLEX=0,
-        flex_positions=None, superflex_positions=None
+        flex_positions=None, superflex_positions=None, BENCH=0
     ):
         self.QB = QB
         self.RB = RB
@@ -27,34 +28,147 @@ class RosterRequirements:
         self.DST = DST
         self.FLEX = FLEX
         self.SUPERFLEX = SUPERFLEX
+        self.BENCH = BENCH
         self.flex_positions = flex_positions or ["RB", "WR", "TE"]
         self.superflex_positions = superflex_positions or ["QB", "RB", "WR", "TE"]
 
+    def slot_groups(self, include_bench=False):
+        """
+        Expand the requirements into ordered slot groups.
+
+        Args:
+            include_bench (bool): Append the BENCH group, eligible for any position.
+
+        Returns:
+            List[Tuple[str, int, List[str]]]: (slot, count, eligible positions) for
+            each slot type, dedicated positions first, then FLEX and SUPERFLEX.
+        """
+        groups = [
+            ("QB", self.QB, ["QB"]),
+            ("RB", self.RB, ["RB"]),
+            ("WR", self.WR, ["WR"]),
+            ("TE", self.TE, ["TE"]),
+            ("K", self.K, ["K"]),
+            ("DST", self.DST, ["DST"]),
+            ("FLEX", self.FLEX, list(self.flex_positions)),
+            ("SUPERFLEX", self.SUPERFLEX, list(self.superflex_positions))
+        ]
+        if include_bench:
+            positions = [pos for _, _, eligible in groups for pos in eligible]
+            groups.append(("BENCH", self.BENCH, list(dict.fromkeys(positions))))
+        return groups
+
 """
 Simulation module for fantasy football rosters.
 """
+import json
+
 import numpy as np
-import pandas as pd
-import random
-import matplotlib.pyplot as plt
 
+from .cache import cache_key, pack_results, unpack_results
+from .lineup import best_lineup_points
+from .optimize import top_rosters
+from .parallel import simulate_parallel
+from .profiling import NULL_PROFILER
+from .sampling import sample_rosters
+from .stats import QUANTILES, StreamingSummary
+from .results import write_results
+from .tables import Player, PlayerTable, RosterBatch, is_frame, load_player_pool
+
+# Player and load_player_pool are re-exported for callers that import them from here
+__all__ = ['ROSTER_PRESETS', 'RosterRequirements', 'RosterSimulator', 'Player', 'load_player_pool']
+
+# Predefined roster types
+ROSTER_PRESETS = {
+    "standard": {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "FLEX": 1},
+    "superflex": {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "SUPERFLEX": 1},
+    "ppr": {"QB": 1, "RB": 2, "WR": 3, "TE": 1, "FLEX": 1},
+}
 
 
 class RosterSimulator:
-    def __init__(self, player_pool, requirements, weeks=14, simulations=1000):
+    def __init__(self, player_pool, requirements, weeks=14, simulations=1000,
+                 shared_draws=False, seed=None, method="monte_carlo", correlation=None, profiler=None):
         """
         Initialize the RosterSimulator.
 
         Args:
-            player_pool (pd.DataFrame or list): Player pool as DataFrame or list of dicts.
+            player_pool (pd.DataFrame, list, str or PlayerTable): Player pool as a DataFrame,
+                a list of Player records or dicts, a PlayerTable, or a file path read
+                with load_player_pool.
             requirements (RosterRequirements): Roster requirements.
             weeks (int): Number of weeks in the season.
             simulations (int): Number of simulation runs.
+            shared_draws (bool): Draw each player's season once per simulation and
+                score every roster from the same draws (common random numbers).
+            seed (int, optional): Seed for the simulator's random generator.
+            method (str): "monte_carlo" draws every player-week; "analytic" uses the
+                closed-form normal season total of independent weekly normals.
+            correlation (CorrelationModel, optional): Correlates teammates' weekly
+                scores. Correlated runs always use Monte Carlo and shared draws.
+            profiler (Profiler, optional): Collects stage timings, counters and
+                progress callbacks; profiling is off when omitted.
         """
+        if method not in ("monte_carlo", "analytic"):
+            raise ValueError(f"Unknown simulation method: {method}")
         self.player_pool = player_pool
         self.requirements = requirements
         self.weeks = weeks
         self.simulations = simulations
+        self.shared_draws = shared_draws
+        self.method = method
+        self.correlation = correlation
+        self.seed = seed
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+
+    @property
+    def analytic(self):
+        """
+        Whether season totals use the closed-form normal model.
+
+        Returns:
+            bool: True when method is "analytic" and no correlation model is set.
+        """
+        return self.method == "analytic" and self.correlation is None
+
+    @property
+    def starters(self):
+        """
+        Number of starting lineup slots.
+
+        Returns:
+            int: Slots filled each week; rosters larger than this carry a bench.
+        """
+        return sum(count for _, count, _ in self.requirements.slot_groups())
+
+    def _check_starters_only(self, roster_size, method):
+        """
+        Reject rosters with a bench in methods that score every rostered player.
+
+        Args:
+            roster_size (int): Players per roster.
+            method (str): Name of the calling method, for the error message.
+        """
+        if roster_size > self.starters:
+            raise ValueError(f"{method} supports starter-only rosters; simulate rosters with a bench "
+                             "as a RosterBatch (see simulate_lineups).")
+
+    @property
+    def correlation_factor(self):
+        """
+        Block-diagonal factor of the correlation model over self.players.
+
+        Returns:
+            CorrelationFactor or None: Factor built once and reused, or None when
+            players are independent.
+        """
+        if self.correlation is None:
+            return None
+        if getattr(self, "_correlation_factor", None) is None:
+            self._correlation_factor = self.correlation.factor(self.players)
+        return self._correlation_factor
 
     def filter_players(self, position):
         """
@@ -66,105 +180,723 @@ class RosterSimulator:
         Returns:
             pd.DataFrame: Filtered DataFrame of players.
         """
-        df = self.player_pool if isinstance(self.player_pool, pd.DataFrame) else pd.DataFrame([vars(p) for p in self.player_pool])
+        df = self.player_pool if is_frame(self.player_pool) else self.players.to_frame()
         return df[df['position'] == position]
 
+    @property
+    def players(self):
+        """
+        Columnar view of the player pool.
+
+        Returns:
+            PlayerTable: Player pool as NumPy arrays, built once and reused.
+        """
+        if getattr(self, "_players", None) is None:
+            with self.profiler.stage("player_table"):
+                self._players = PlayerTable.from_pool(self.player_pool)
+        return self._players
+
     def generate_rosters(self, max_rosters=1000):
         """
         Generate random valid rosters using vectorized sampling.
 
         Args:
-            max_rosters (int): Maximum number of rosters to sample.
+            max_rosters (int): Number of unique rosters to sample. Fewer are returned,
+                with a warning, when the player pool is exhausted.
 
         Returns:
-            List[pd.DataFrame]: List of DataFrames, each representing a roster.
-        """
-        import numpy as np
-        import pandas as pd
-        req = self.requirements
-        df = self.player_pool if isinstance(self.player_pool, pd.DataFrame) else pd.DataFrame([vars(p) for p in self.player_pool])
-        pos_groups = [
-            (df.index[df['position'] == 'QB'].to_numpy(), req.QB),
-            (df.index[df['position'] == 'RB'].to_numpy(), req.RB),
-            (df.index[df['position'] == 'WR'].to_numpy(), req.WR),
-            (df.index[df['position'] == 'TE'].to_numpy(), req.TE),
-            (df.index[df['position'] == 'K'].to_numpy(), req.K),
-            (df.index[df['position'] == 'DST'].to_numpy(), req.DST),
-            (df.index[df['position'].isin(req.flex_positions)].to_numpy(), req.FLEX),
-            (df.index[df['position'].isin(req.superflex_positions)].to_numpy(), req.SUPERFLEX)
-        ]
-        roster_matrix = []
-        for idx, count in pos_groups:
-            if count > 0:
-                samples = np.array([np.random.choice(idx, min(count, len(idx)), replace=False) for _ in range(max_rosters)])
-                roster_matrix.append(samples)
-        if roster_matrix:
-            roster_matrix = np.concatenate(roster_matrix, axis=1)
-        else:
-            roster_matrix = np.empty((max_rosters, 0), dtype=int)
-        unique_mask = np.array([len(np.unique(row)) == row.size for row in roster_matrix])
-        unique_rosters = roster_matrix[unique_mask]
-        # Return list of DataFrames, each representing a roster
-        return [df.loc[list(roster)].reset_index(drop=True) for roster in unique_rosters]
+            RosterBatch: Sampled rosters as an index matrix into self.players.
+        """
+        return sample_rosters(self.players, self.requirements, max_rosters, self.rng, profiler=self.profiler)
 
-    def simulate_season(self, roster_df):
+    def optimize(self, top_k=10):
+        """
+        Find the exact best rosters by expected season points.
+
+        Args:
+            top_k (int): Number of rosters to return.
+
+        Returns:
+            RosterBatch: Up to top_k rosters, best first.
+        """
+        with self.profiler.stage("optimize"):
+            return top_rosters(self.players, self.requirements, top_k)
+
+    def simulate_season(self, roster):
         """
         Simulate a fantasy football season for a given roster.
 
         Args:
-            roster_df (pd.DataFrame): DataFrame of player projections.
+            roster (pd.DataFrame or RosterBatch): DataFrame of player projections,
+                or a batch of rosters.
+
+        Rosters larger than the starting lineup start their best legal lineup each
+        week (see simulate_lineups). With bench spots in the requirements this needs
+        a RosterBatch; without them, every player of a DataFrame roster scores.
+
+        Returns:
+            List[float] or np.ndarray: Total points for each simulation. A RosterBatch
+            yields a (n_rosters, simulations) array.
+        """
+        if isinstance(roster, RosterBatch):
+            if roster.roster_size > self.starters:
+                return self.simulate_lineups(roster)
+            players = roster.players
+            return np.array([
+                self._season_points(players.proj_mean[row], players.proj_sd[row],
+                                    self._roster_factor(players.position[row], players.team[row]))
+                for row in roster.index
+            ])
+        if self.requirements.BENCH:
+            self._check_starters_only(len(roster), "simulate_season with a DataFrame roster")
+        means = roster['proj_mean'].to_numpy()
+        sds = roster['proj_sd'].to_numpy()
+        factor = None
+        if self.correlation is not None:
+            teams = roster['team'].fillna("").to_numpy() if 'team' in roster else np.full(len(roster), "")
+            factor = self._roster_factor(roster['position'].to_numpy(), teams)
+        return self._season_points(means, sds, factor).tolist()
+
+    def _roster_factor(self, positions, teams):
+        """
+        Cholesky factor of one roster's correlation matrix.
+
+        Args:
+            positions (np.ndarray): Positions of the rostered players.
+            teams (np.ndarray): Teams of the rostered players.
+
+        Returns:
+            np.ndarray or None: Factor, or None when no correlation model is set.
+        """
+        if self.correlation is None:
+            return None
+        return self.correlation.cholesky(positions, teams)
+
+    def _season_points(self, means, sds, factor=None):
+        """
+        Draw season totals for one roster.
+
+        Args:
+            means (np.ndarray): Weekly projected mean for each rostered player.
+            sds (np.ndarray): Weekly projected standard deviation for each rostered player.
+            factor (np.ndarray, optional): Cholesky factor of the roster's correlation matrix.
 
         Returns:
-            List[float]: Total points for each simulation.
+            np.ndarray: Total points for each simulation.
         """
-        means = roster_df['proj_mean'].to_numpy()
-        sds = roster_df['proj_sd'].to_numpy()
-        scores = np.random.normal(
+        if self.analytic:
+            self.profiler.count("draws", self.simulations)
+            return self.rng.normal(self.weeks * means.sum(), np.sqrt(self.weeks * (sds ** 2).sum()),
+                                   size=self.simulations)
+        self.profiler.count("draws", self.simulations * self.weeks * len(means))
+        if factor is not None:
+            z = self.rng.standard_normal((self.simulations, self.weeks, len(means))) @ factor.T
+            return (means + sds * z).sum(axis=2).sum(axis=1)
+        scores = self.rng.normal(
             loc=means[None, None, :],
             scale=sds[None, None, :],
             size=(self.simulations, self.weeks, len(means))
         )
-        season_points = scores.sum(axis=2).sum(axis=1)
-        return season_points.tolist()
+        return scores.sum(axis=2).sum(axis=1)
 
-    def _simulate_roster(self, roster_df):
+    def _simulate_roster(self, roster):
         """
         Simulate a single roster and return summary statistics.
 
         Args:
-            roster_df (pd.DataFrame): DataFrame of player projections.
+            roster (pd.DataFrame or RosterBatch): DataFrame of player projections,
+                or a single-row RosterBatch.
 
         Returns:
-            dict: Roster names, average score, and score distribution.
+            dict: Roster (names, or player indices for a RosterBatch), average score,
+            and score distribution.
         """
-        scores = self.simulate_season(roster_df)
+        if isinstance(roster, RosterBatch):
+            scores = self.simulate_season(roster)[0]
+            return {
+                "roster": roster.index[0],
+                "average_score": scores.mean(),
+                "score_distribution": scores.tolist()
+            }
+        scores = self.simulate_season(roster)
         avg_score = np.mean(scores)
         return {
-            "roster": roster_df['name'].tolist(),
+            "roster": roster['name'].tolist(),
             "average_score": avg_score,
             "score_distribution": scores
         }
 
-    def run_simulation(self, max_rosters=1000, use_multiprocessing=True):
+    def roster_names(self, roster):
+        """
+        Resolve a result's roster to player names.
+
+        Args:
+            roster (np.ndarray or list): Player indices into self.players, or names.
+
+        Returns:
+            List[str]: Player names.
+        """
+        if isinstance(roster, np.ndarray):
+            return self.players.name[roster].tolist()
+        return list(roster)
+
+    def draw_player_seasons(self, means, sds, simulations=None, rng=None, players=None):
+        """
+        Draw one season total per player for every simulation.
+
+        Args:
+            means (np.ndarray): Weekly projected mean for each player.
+            sds (np.ndarray): Weekly projected standard deviation for each player.
+            simulations (int, optional): Number of seasons; defaults to self.simulations.
+            rng (np.random.Generator, optional): Generator to draw from; defaults to self.rng.
+            players (np.ndarray, optional): Positions in self.players that means and sds
+                describe, when they cover a subset; used by the correlation model.
+
+        Returns:
+            np.ndarray: (simulations, n_players) array of season totals.
+        """
+        rng = rng if rng is not None else self.rng
+        if self.analytic:
+            # A sum of independent weekly normals is normal; draw the total directly
+            self.profiler.count("draws", (simulations or self.simulations) * len(means))
+            return rng.normal(self.weeks * means, np.sqrt(self.weeks) * sds,
+                              size=(simulations or self.simulations, len(means)))
+        totals = np.zeros((simulations or self.simulations, len(means)))
+        # Accumulate week by week so memory stays at one (simulations, n_players) slab
+        for _ in range(self.weeks):
+            totals += self._draw_week(means, sds, len(totals), rng, players)
+        return totals
+
+    def draw_player_weeks(self, means, sds, simulations=None, rng=None, players=None):
+        """
+        Draw every player's weekly points for every simulation.
+
+        Args:
+            means (np.ndarray): Weekly projected mean for each player.
+            sds (np.ndarray): Weekly projected standard deviation for each player.
+            simulations (int, optional): Number of seasons; defaults to self.simulations.
+            rng (np.random.Generator, optional): Generator to draw from; defaults to self.rng.
+            players (np.ndarray, optional): Positions in self.players that means and sds
+                describe, when they cover a subset; used by the correlation model.
+
+        Returns:
+            np.ndarray: (simulations, weeks, n_players) weekly points.
+        """
+        rng = rng if rng is not None else self.rng
+        simulations = simulations or self.simulations
+        return np.stack([self._draw_week(means, sds, simulations, rng, players) for _ in range(self.weeks)], axis=1)
+
+    def _draw_week(self, means, sds, simulations, rng, players=None):
+        """
+        Draw one week of points per player for every simulation.
+
+        Args:
+            means (np.ndarray): Weekly projected mean for each player.
+            sds (np.ndarray): Weekly projected standard deviation for each player.
+            simulations (int): Number of seasons.
+            rng (np.random.Generator): Generator to draw from.
+            players (np.ndarray, optional): Positions in self.players of a subset.
+
+        Returns:
+            np.ndarray: (simulations, n_players) weekly points.
+        """
+        self.profiler.count("draws", simulations * len(means))
+        factor = self.correlation_factor
+        if factor is None:
+            return rng.normal(means, sds, size=(simulations, len(means)))
+        z = factor.standard_normal(rng, simulations)
+        return means + sds * (z if players is None else z[:, players])
+
+    def simulate_lineups(self, rosters, max_elements=2 ** 24, requirements=None):
+        """
+        Simulate seasons where each week starts the best legal lineup.
+
+        Rosters hold starters and bench. Every simulated week, the lineup that
+        maximizes points under the requirements (including FLEX/SUPERFLEX) is
+        picked from the week's draws, vectorized across simulations and rosters.
+
+        Args:
+            rosters (RosterBatch): Rosters including bench players.
+            max_elements (int): Cap on the size of each (simulations, weeks, rosters,
+                roster_size) block, bounding memory.
+            requirements (RosterRequirements, optional): Lineup requirements; defaults
+                to the simulator's.
+
+        Returns:
+            np.ndarray: (n_rosters, simulations) season totals of started players.
+        """
+        totals = np.empty((len(rosters), self.simulations))
+        chunk = max(1, max_elements // (self.weeks * rosters.index.size or 1))
+        for start in range(0, self.simulations, chunk):
+            size = min(chunk, self.simulations - start)
+            weekly = self.weekly_points(rosters, simulations=size, requirements=requirements)
+            totals[:, start:start + size] = weekly.sum(axis=1).T
+            self.profiler.progress("simulate", start + size, self.simulations)
+        return totals
+
+    def weekly_points(self, rosters, simulations=None, rng=None, players=None, requirements=None):
+        """
+        Points each roster scores every simulated week.
+
+        Rosters larger than the starting lineup start their best legal lineup
+        each week; rosters of starters only score every player.
+
+        Args:
+            rosters (RosterBatch): Rosters to score.
+            simulations (int, optional): Number of seasons; defaults to self.simulations.
+            rng (np.random.Generator, optional): Generator to draw from; defaults to self.rng.
+            players (np.ndarray, optional): Sorted positions in rosters.players to draw,
+                covering every rostered player; defaults to the players on some roster.
+                Fixing it makes a subset of rosters see the same draws as the full batch.
+            requirements (RosterRequirements, optional): Lineup requirements; defaults
+                to the simulator's.
+
+        Returns:
+            np.ndarray: (simulations, weeks, n_rosters) weekly points.
+        """
+        table = rosters.players
+        if players is None:
+            # Only draw players that appear on some roster
+            used, index = np.unique(rosters.index, return_inverse=True)
+            index = index.reshape(rosters.index.shape)
+        else:
+            used, index = players, np.searchsorted(players, rosters.index)
+        with self.profiler.stage("draw"):
+            weekly = self.draw_player_weeks(table.proj_mean[used], table.proj_sd[used],
+                                            simulations=simulations, rng=rng, players=used)
+        requirements = requirements or self.requirements
+        starters = sum(count for _, count, _ in requirements.slot_groups())
+        with self.profiler.stage("lineups"):
+            if rosters.roster_size > starters:
+                return best_lineup_points(weekly[..., index], table.position[rosters.index], requirements)
+            return weekly @ self.incidence_matrix(index, len(used)).T
+
+    @staticmethod
+    def incidence_matrix(roster_matrix, n_players):
+        """
+        Build a roster-by-player incidence matrix.
+
+        Args:
+            roster_matrix (np.ndarray): (n_rosters, roster_size) player positions.
+            n_players (int): Number of players in the pool.
+
+        Returns:
+            np.ndarray: (n_rosters, n_players) matrix with 1.0 where a player is rostered.
+        """
+        incidence = np.zeros((len(roster_matrix), n_players))
+        rows = np.repeat(np.arange(len(roster_matrix)), roster_matrix.shape[1])
+        np.add.at(incidence, (rows, roster_matrix.ravel()), 1.0)
+        return incidence
+
+    def simulate_shared(self, rosters):
+        """
+        Score many rosters against a single set of player draws.
+
+        Each player's season is drawn once per simulation and every roster is
+        scored with one matrix product, so roster comparisons share their noise.
+        Rosters with a bench share weekly draws and start their best lineup each
+        week (see simulate_lineups).
+
+        Args:
+            rosters (RosterBatch): Rosters to score.
+
+        Returns:
+            np.ndarray: (simulations, n_rosters) season totals.
+        """
+        if rosters.roster_size > self.starters:
+            return self.simulate_lineups(rosters).T
+        players = rosters.players
+        with self.profiler.stage("draw"):
+            season_points = self.draw_player_seasons(players.proj_mean, players.proj_sd)
+        with self.profiler.stage("score"):
+            return season_points @ self.incidence_matrix(rosters.index, len(players)).T
+
+    def _run_shared(self, rosters):
+        """
+        Run the shared-draw simulation for a batch of rosters.
+
+        Args:
+            rosters (RosterBatch): Rosters to simulate.
+
+        Returns:
+            List[dict]: Simulation results for each roster.
+        """
+        return self._results(rosters, self.simulate_shared(rosters).T)
+
+    @staticmethod
+    def _results(rosters, scores):
+        """
+        Build result dicts from a score matrix.
+
+        Args:
+            rosters (RosterBatch): Simulated rosters.
+            scores (np.ndarray): (n_rosters, simulations) season totals.
+
+        Returns:
+            List[dict]: Player indices, average score and score distribution per roster.
+        """
+        return [
+            {
+                "roster": roster,
+                "average_score": scores[i].mean(),
+                "score_distribution": scores[i].tolist()
+            }
+            for i, roster in enumerate(rosters.index)
+        ]
+
+    def run_simulation(self, max_rosters=1000, use_multiprocessing=True, shared_draws=None,
+                       optimize=False, processes=None, summary=False, keep_top=1, cache=None, out=None):
         """
         Run simulations for multiple rosters in parallel.
 
         Args:
             max_rosters (int): Maximum number of rosters to sample.
             use_multiprocessing (bool): Whether to use multiprocessing.
+            shared_draws (bool, optional): Override the simulator's shared_draws setting.
+                Shared draws run in-process; use_multiprocessing is ignored. Correlated
+                simulators always use shared draws.
+            optimize (bool): Simulate the exact max_rosters best rosters by expected
+                points instead of a random sample.
+            processes (int, optional): Number of workers in the persistent pool.
+                Results for a given seed do not depend on it.
+            summary (bool): Stream shared draws in chunks and return summary
+                statistics instead of full score distributions (see run_streaming).
+            keep_top (int): With summary, number of top rosters that keep their
+                full score distribution.
+            cache (ResultCache, optional): Reuse results of an identical earlier run.
+                Only seeded simulators are cached; see cache_key. A hit also restores
+                the generator state the run left behind, so caching never changes
+                what later calls draw.
+            out (str, optional): Also write the results to this columnar results
+                directory (see write_results), readable later with ResultsFile.
+
+        Rosters with bench spots are simulated with weekly start/sit decisions
+        (see simulate_lineups); with summary they stream like starter-only rosters.
 
         Returns:
-            List[dict]: Simulation results for each roster.
+            List[dict]: Simulation results for each roster. Each "roster" holds player
+            indices into self.players; use roster_names to resolve them.
         """
-        import multiprocessing as mp
-        rosters = self.generate_rosters(max_rosters=max_rosters)
-        if use_multiprocessing and len(rosters) > 1:
-            with mp.Pool() as pool:
-                results = pool.map(self._simulate_roster, rosters)
+        if out is not None:
+            results = self.run_simulation(max_rosters, use_multiprocessing, shared_draws, optimize,
+                                          processes, summary, keep_top, cache)
+            with self.profiler.stage("write_results"):
+                write_results(out, results, self.players, weeks=self.weeks, simulations=self.simulations)
+            return results
+        if cache is not None and self.seed is not None:
+            key = self.cache_key(
+                "run_simulation", max_rosters, shared_draws, optimize, summary, keep_top
+            )
+            with self.profiler.stage("cache"):
+                cached = cache.get(key)
+            if cached is not None and "generator_state" in cached:
+                self.profiler.count("cache_hits")
+                self._restore_generator_state(cached)
+                return unpack_results(cached)
+            results = self.run_simulation(max_rosters, use_multiprocessing, shared_draws,
+                                          optimize, processes, summary, keep_top)
+            with self.profiler.stage("cache"):
+                cache.put(key, {**pack_results(results), **self._generator_state()})
+            return results
+        if optimize:
+            rosters = self.optimize(top_k=max_rosters)
         else:
-            results = [self._simulate_roster(roster) for roster in rosters]
+            rosters = self.generate_rosters(max_rosters=max_rosters)
+        if summary:
+            with self.profiler.stage("simulate"):
+                return self.run_streaming(rosters, keep_top=keep_top)
+        with self.profiler.stage("simulate"):
+            if self.requirements.BENCH:
+                scores = self.simulate_lineups(rosters)
+            elif self.correlation is not None or (self.shared_draws if shared_draws is None else shared_draws):
+                scores = self.simulate_shared(rosters).T
+            elif self.analytic:
+                mean, std = self.season_moments(rosters)
+                self.profiler.count("draws", len(rosters) * self.simulations)
+                scores = self.rng.normal(mean[:, None], std[:, None], size=(len(rosters), self.simulations))
+            else:
+                scores = simulate_parallel(rosters, self.weeks, self.simulations, self.seed_sequence,
+                                           use_multiprocessing=use_multiprocessing, processes=processes,
+                                           profiler=self.profiler)
+        with self.profiler.stage("results"):
+            return self._results(rosters, scores)
+
+    def cache_key(self, *params):
+        """
+        Content hash of the player pool, simulator settings and generator state.
+
+        Worker counts are left out because results do not depend on them.
+
+        Args:
+            *params: Call-specific parameters to include.
+
+        Returns:
+            str: Cache key.
+        """
+        players = self.players
+        correlation = None
+        if self.correlation is not None:
+            correlation = [self.correlation.team_corr, sorted(map(list, self.correlation.position_pairs.items()))]
+        return cache_key(
+            players.name, players.team, players.position, players.proj_mean, players.proj_sd,
+            vars(self.requirements), self.weeks, self.simulations, self.shared_draws, self.method,
+            correlation, self.seed, self.seed_sequence.n_children_spawned, self.rng.bit_generator.state,
+            list(params)
+        )
+
+    def _generator_state(self):
+        """
+        Generator state to store with cached results.
+
+        Returns:
+            dict: The bit generator state as JSON and the number of seed sequence
+            children spawned so far.
+        """
+        return {
+            "generator_state": np.array(json.dumps(self.rng.bit_generator.state)),
+            "children_spawned": np.array(self.seed_sequence.n_children_spawned)
+        }
+
+    def _restore_generator_state(self, arrays):
+        """
+        Leave the generators as the cached run left them, so later calls draw the
+        same numbers as they would after an uncached run.
+
+        Args:
+            arrays (dict): Cached payload holding _generator_state arrays.
+        """
+        self.rng.bit_generator.state = json.loads(str(arrays["generator_state"]))
+        sequence = self.seed_sequence
+        self.seed_sequence = np.random.SeedSequence(
+            sequence.entropy, spawn_key=sequence.spawn_key, pool_size=sequence.pool_size,
+            n_children_spawned=int(arrays["children_spawned"])
+        )
+
+    def season_moments(self, rosters):
+        """
+        Exact mean and standard deviation of each roster's season total.
+
+        Args:
+            rosters (RosterBatch): Rosters to evaluate.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Mean and standard deviation per roster.
+
+        Raises:
+            ValueError: If the rosters carry a bench.
+        """
+        self._check_starters_only(rosters.roster_size, "season_moments")
+        return (self.weeks * rosters.means.sum(axis=1),
+                np.sqrt(self.weeks * (rosters.sds ** 2).sum(axis=1)))
+
+    def analytic_summary(self, rosters, keep_top=1):
+        """
+        Exact summary statistics for every roster in one vectorized pass.
+
+        Args:
+            rosters (RosterBatch): Rosters to evaluate.
+            keep_top (int): Number of top rosters that get a sampled score_distribution.
+
+        Returns:
+            List[dict]: For each roster, its player indices, average score, standard
+            deviation and P10/P50/P90; top rosters also carry score_distribution.
+
+        Raises:
+            ValueError: If the rosters carry a bench.
+        """
+        from statistics import NormalDist
+        self._check_starters_only(rosters.roster_size, "analytic_summary")
+        mean, std = self.season_moments(rosters)
+        z = np.array([NormalDist().inv_cdf(q) for q in QUANTILES])
+        quantiles = mean[:, None] + std[:, None] * z
+        results = [
+            {
+                "roster": roster,
+                "average_score": mean[i],
+                "std": std[i],
+                "p10": quantiles[i, 0],
+                "p50": quantiles[i, 1],
+                "p90": quantiles[i, 2]
+            }
+            for i, roster in enumerate(rosters.index)
+        ]
+        for i in np.argsort(-mean, kind="stable")[:keep_top]:
+            results[i]["score_distribution"] = self.rng.normal(mean[i], std[i], size=self.simulations).tolist()
+        return results
+
+    def run_streaming(self, rosters, keep_top=1, chunk_size=1000, bins=100):
+        """
+        Simulate rosters in fixed-size chunks of shared draws, keeping only summaries.
+
+        Each chunk of seasons updates a running mean/variance and a fixed-bin
+        histogram per roster, so memory does not grow with the number of
+        simulations. The keep_top best rosters are then replayed from the same
+        chunk seeds to recover their exact score distributions.
+
+        Args:
+            rosters (RosterBatch): Rosters to simulate.
+            keep_top (int): Number of top rosters (by average score) that keep
+                their full score distribution.
+            chunk_size (int): Seasons simulated per chunk.
+            bins (int): Histogram bins per roster.
+
+        Returns:
+            List[dict]: For each roster, its player indices, average score, standard
+            deviation, P10/P50/P90, histogram counts and bin edges; top rosters also
+            carry score_distribution. The analytic method returns analytic_summary
+            for starter-only rosters; rosters with a bench always use weekly draws.
+        """
+        bench = rosters.roster_size > self.starters
+        if self.analytic and not bench:
+            return self.analytic_summary(rosters, keep_top=keep_top)
+        players = rosters.players
+        spread = 6 * np.sqrt(self.weeks * (rosters.sds ** 2).sum(axis=1))
+        if bench:
+            used = np.unique(rosters.index)
+            # The lineup picked by projected means bounds the expected lineup total
+            # from below; starting every rostered player bounds it from above
+            lower = self.weeks * best_lineup_points(rosters.means, players.position[rosters.index],
+                                                    self.requirements) - spread
+            upper = self.weeks * rosters.means.sum(axis=1) + spread
+        else:
+            incidence = self.incidence_matrix(rosters.index, len(players))
+            # Histogram range from the exact mean and spread of independent weekly normals
+            center = self.weeks * rosters.means.sum(axis=1)
+            lower, upper = center - spread, center + spread
+        stats = StreamingSummary(lower, upper, bins=bins)
+        sizes = [min(chunk_size, self.simulations - start) for start in range(0, self.simulations, chunk_size)]
+        seeds = self.seed_sequence.spawn(len(sizes))
+
+        def chunks(columns):
+            for size, seed in zip(sizes, seeds):
+                rng = np.random.default_rng(seed)
+                if bench:
+                    # Draw every player of the full batch so replayed rosters see the same weeks
+                    yield self.weekly_points(rosters[columns], simulations=size, rng=rng, players=used).sum(axis=1)
+                    continue
+                seasons = self.draw_player_seasons(players.proj_mean, players.proj_sd, simulations=size, rng=rng)
+                yield seasons @ incidence[columns].T
+
+        for done, scores in enumerate(chunks(slice(None)), 1):
+            stats.update(scores)
+            self.profiler.progress("simulate", done, len(sizes))
+
+        top = np.argsort(-stats.mean, kind="stable")[:keep_top]
+        distributions = np.concatenate(list(chunks(top))) if len(top) else None
+        quantiles = stats.quantiles(QUANTILES)
+        results = [
+            {
+                "roster": roster,
+                "average_score": stats.mean[i],
+                "std": stats.std[i],
+                "p10": quantiles[i, 0],
+                "p50": quantiles[i, 1],
+                "p90": quantiles[i, 2],
+                "histogram": stats.histogram[i],
+                "bin_edges": stats.bin_edges(i)
+            }
+            for i, roster in enumerate(rosters.index)
+        ]
+        for j, i in enumerate(top):
+            results[i]["score_distribution"] = distributions[:, j].tolist()
         return results
 
+    @staticmethod
+    def _running_stats(n, total, total_sq):
+        """
+        Mean and standard error from running sums.
+
+        Args:
+            n (np.ndarray): Draws per roster.
+            total (np.ndarray): Sum of scores per roster.
+            total_sq (np.ndarray): Sum of squared scores per roster.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Mean and standard error per roster.
+        """
+        n = np.maximum(n, 1)
+        mean = total / n
+        var = np.maximum(total_sq / n - mean ** 2, 0) * n / np.maximum(n - 1, 1)
+        return mean, np.sqrt(var / n)
+
+    def run_adaptive(self, rosters=None, max_rosters=1000, top_n=10, round_size=50,
+                     budget=None, precision=None, confidence=0.95):
+        """
+        Rank rosters with an adaptive simulation budget.
+
+        All candidates are simulated in rounds of round_size seasons from shared
+        player draws. After each round, rosters whose confidence interval cannot
+        reach the current top_n are dropped and later rounds go to the contenders.
+        Rosters with a bench start their best lineup each simulated week.
+
+        Args:
+            rosters (RosterBatch, optional): Candidate rosters; sampled when omitted.
+            max_rosters (int): Number of rosters to sample when rosters is omitted.
+            top_n (int): Number of top rosters to separate from the field.
+            round_size (int): Seasons simulated per roster in each round.
+            budget (int, optional): Total roster-seasons to simulate. Defaults to
+                simulations per roster when precision is not given either.
+            precision (float, optional): Stop once every contender's confidence
+                interval half-width is at most this many points.
+            confidence (float): Confidence level of the intervals.
+
+        Returns:
+            List[dict]: For each roster, its player indices, average score, standard
+            error and the number of draws it received.
+        """
+        from statistics import NormalDist
+        if rosters is None:
+            rosters = self.generate_rosters(max_rosters=max_rosters)
+        if budget is None and precision is None:
+            budget = self.simulations * len(rosters)
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        players = rosters.players
+        bench = rosters.roster_size > self.starters
+        incidence = None if bench else self.incidence_matrix(rosters.index, len(players))
+        draws = np.zeros(len(rosters), dtype=np.int64)
+        total = np.zeros(len(rosters))
+        total_sq = np.zeros(len(rosters))
+        alive = np.arange(len(rosters))
+        used = 0
+        while len(alive):
+            size = round_size
+            if budget is not None:
+                size = min(size, (budget - used) // len(alive))
+                if size < 2:
+                    break
+            # Only players still on a contending roster need draws
+            if bench:
+                scores = self.weekly_points(rosters[alive], simulations=size).sum(axis=1)
+            else:
+                active = np.unique(rosters.index[alive])
+                seasons = self.draw_player_seasons(players.proj_mean[active], players.proj_sd[active],
+                                                   simulations=size, players=active)
+                scores = seasons @ incidence[np.ix_(alive, active)].T
+            draws[alive] += size
+            total[alive] += scores.sum(axis=0)
+            total_sq[alive] += (scores ** 2).sum(axis=0)
+            used += size * len(alive)
+
+            mean, std_error = self._running_stats(draws[alive], total[alive], total_sq[alive])
+            half_width = z * std_error
+            if len(alive) > top_n:
+                threshold = np.partition(mean - half_width, -top_n)[-top_n]
+                keep = mean + half_width >= threshold
+                alive, half_width = alive[keep], half_width[keep]
+            if precision is not None and (half_width <= precision).all():
+                break
+
+        mean, std_error = self._running_stats(draws, total, total_sq)
+        return [
+            {
+                "roster": roster,
+                "average_score": mean[i],
+                "std_error": std_error[i],
+                "draws": int(draws[i])
+            }
+            for i, roster in enumerate(rosters.index)
+        ]
+
     def plot_top_roster(self, results, top_n=1):
         """
         Plot the score distribution for the top roster(s).
@@ -175,8 +907,9 @@ class RosterSimulator:
         """
         top_rosters = sorted(results, key=lambda x: x["average_score"], reverse=True)[:top_n]
         for i, r in enumerate(top_rosters, 1):
-            print(f"Roster {i}: {r['roster']}")
+            print(f"Roster {i}: {self.roster_names(r['roster'])}")
             print(f"Average Season Score: {r['average_score']:.2f}\n")
+        import matplotlib.pyplot as plt
         plt.hist(top_rosters[0]["score_distribution"], bins=30, alpha=0.7)
         plt.title("Score Distribution for Top Roster")
         plt.xlabel("Season Points")
@@ -0,0 +1,93 @@
+"""
+Streaming summary statistics for simulated season totals.
+"""
+import numpy as np
+
+QUANTILES = (0.1, 0.5, 0.9)
+
+
+class StreamingSummary:
+    """
+    Running mean/variance and a fixed-bin histogram for many rosters.
+
+    Scores are added in chunks and never stored; quantiles are read off the
+    histogram by linear interpolation within a bin.
+
+    Args:
+        lower (np.ndarray): Lower histogram edge per roster.
+        upper (np.ndarray): Upper histogram edge per roster.
+        bins (int): Number of bins between the edges. Scores outside the edges
+            are counted in the first or last bin.
+    """
+    def __init__(self, lower, upper, bins=100):
+        self.lower = np.asarray(lower, dtype=np.float64)
+        self.width = (np.asarray(upper, dtype=np.float64) - self.lower) / bins
+        self.bins = bins
+        self.count = 0
+        self.mean = np.zeros(len(self.lower))
+        self.m2 = np.zeros(len(self.lower))
+        self.histogram = np.zeros((len(self.lower), bins), dtype=np.int64)
+
+    def update(self, scores):
+        """
+        Add a chunk of simulated seasons.
+
+        Args:
+            scores (np.ndarray): (n_simulations, n_rosters) season totals.
+        """
+        n = len(scores)
+        if not n:
+            return
+        # Chan et al. parallel update of mean and sum of squared deviations
+        chunk_mean = scores.mean(axis=0)
+        chunk_m2 = ((scores - chunk_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+
+        bin_index = np.floor((scores - self.lower) / self.width).astype(np.int64)
+        np.clip(bin_index, 0, self.bins - 1, out=bin_index)
+        flat = (bin_index + np.arange(scores.shape[1]) * self.bins).ravel()
+        self.histogram += np.bincount(flat, minlength=self.histogram.size).reshape(self.histogram.shape)
+
+    @property
+    def std(self):
+        """Sample standard deviation per roster."""
+        return np.sqrt(self.m2 / max(self.count - 1, 1))
+
+    def bin_edges(self, i):
+        """
+        Histogram bin edges for one roster.
+
+        Args:
+            i (int): Roster position.
+
+        Returns:
+            np.ndarray: bins + 1 edges.
+        """
+        return self.lower[i] + self.width[i] * np.arange(self.bins + 1)
+
+    def quantiles(self, q=QUANTILES):
+        """
+        Approximate quantiles per roster from the histogram.
+
+        Args:
+            q (Sequence[float]): Quantile levels in [0, 1].
+
+        Returns:
+            np.ndarray: (n_rosters, len(q)) quantile estimates.
+        """
+        cumulative = np.cumsum(self.histogram, axis=1)
+        out = np.empty((len(self.lower), len(q)))
+        for j, level in enumerate(q):
+            target = level * self.count
+            # First bin whose cumulative count reaches the target
+            b = np.minimum((cumulative < target).sum(axis=1), self.bins - 1)
+            rows = np.arange(len(b))
+            before = np.where(b > 0, cumulative[rows, np.maximum(b - 1, 0)], 0)
+            in_bin = np.maximum(self.histogram[rows, b], 1)
+            fraction = np.clip((target - before) / in_bin, 0, 1)
+            out[:, j] = self.lower + self.width * (b + fraction)
+        return out
@@ -0,0 +1,318 @@
+"""
+Columnar player and roster containers used by the simulation engine.
+"""
+import json
+import os
+import sys
+
+import numpy as np
+
+# Columns the simulator reads from a player pool file, with their dtypes
+PLAYER_DTYPES = {
+    'name': 'string',
+    'team': 'string',
+    'position': 'category',
+    'proj_mean': np.float64,
+    'proj_sd': np.float64
+}
+REQUIRED_COLUMNS = ('name', 'position', 'proj_mean', 'proj_sd')
+
+
+def is_frame(obj):
+    """
+    Check for a pandas DataFrame without importing pandas.
+
+    Args:
+        obj: Object to check.
+
+    Returns:
+        bool: True when obj is a DataFrame; pandas cannot have built one if it was never imported.
+    """
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
+class Player:
+    """
+    A single player record.
+
+    Args:
+        name (str): Player name.
+        team (str): Player team.
+        position (str): Player position.
+        proj_floor (float): Weekly projected floor.
+        proj_mean (float): Weekly projected mean points.
+        proj_ceiling (float): Weekly projected ceiling.
+        proj_sd (float): Weekly projected standard deviation.
+    """
+    __slots__ = ('name', 'team', 'position', 'proj_floor', 'proj_mean', 'proj_ceiling', 'proj_sd')
+
+    def __init__(self, name, team, position, proj_floor, proj_mean, proj_ceiling, proj_sd):
+        self.name = name
+        self.team = team
+        self.position = position
+        self.proj_floor = proj_floor
+        self.proj_mean = proj_mean
+        self.proj_ceiling = proj_ceiling
+        self.proj_sd = proj_sd
+
+    def __repr__(self):
+        return f"Player({self.name!r}, {self.team!r}, {self.position!r}, mean={self.proj_mean}, sd={self.proj_sd})"
+
+    def to_dict(self):
+        """
+        Convert the record to a dict.
+
+        Returns:
+            dict: Field name to value.
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class PlayerTable:
+    """
+    Columnar player pool backed by NumPy arrays.
+
+    Args:
+        name (array-like): Player names.
+        position (array-like): Player positions.
+        proj_mean (array-like): Weekly projected mean points.
+        proj_sd (array-like): Weekly projected standard deviation.
+        team (array-like, optional): Player teams.
+    """
+    def __init__(self, name, position, proj_mean, proj_sd, team=None):
+        self.name = np.asarray(name, dtype=object)
+        self.position = np.asarray(position, dtype=object)
+        self.proj_mean = np.ascontiguousarray(proj_mean, dtype=np.float64)
+        self.proj_sd = np.ascontiguousarray(proj_sd, dtype=np.float64)
+        self.team = np.asarray(team if team is not None else [""] * len(self.name), dtype=object)
+
+    @classmethod
+    def from_pool(cls, player_pool):
+        """
+        Build a PlayerTable from a DataFrame, a list of players or dicts, a file
+        path, or a PlayerTable.
+
+        Args:
+            player_pool (pd.DataFrame, list, str or PlayerTable): Player pool; paths
+                are read with load_player_pool.
+
+        Returns:
+            PlayerTable: Columnar player pool.
+        """
+        if isinstance(player_pool, cls):
+            return player_pool
+        if isinstance(player_pool, (str, os.PathLike)):
+            return load_player_pool(player_pool)
+        if is_frame(player_pool):
+            df = player_pool
+        elif all(isinstance(p, Player) for p in player_pool):
+            # Records map straight onto columns without an intermediate DataFrame
+            return cls(
+                [p.name for p in player_pool],
+                [p.position for p in player_pool],
+                [p.proj_mean for p in player_pool],
+                [p.proj_sd for p in player_pool],
+                team=[p.team or "" for p in player_pool]
+            )
+        else:
+            import pandas as pd
+            df = pd.DataFrame([p if isinstance(p, dict) else p.to_dict() for p in player_pool])
+        return cls(
+            df['name'].to_numpy(),
+            df['position'].to_numpy(),
+            df['proj_mean'].to_numpy(),
+            df['proj_sd'].to_numpy(),
+            team=df['team'].fillna("").to_numpy() if 'team' in df else None
+        )
+
+    def __len__(self):
+        return len(self.name)
+
+    def to_players(self):
+        """
+        Convert the table to Player records.
+
+        Returns:
+            List[Player]: One record per player; floor and ceiling are unknown.
+        """
+        return [
+            Player(name, team, position, None, mean, None, sd)
+            for name, team, position, mean, sd in zip(
+                self.name, self.team, self.position, self.proj_mean.tolist(), self.proj_sd.tolist()
+            )
+        ]
+
+    def to_frame(self):
+        """
+        Convert the table to a DataFrame.
+
+        Returns:
+            pd.DataFrame: One row per player.
+        """
+        import pandas as pd
+        return pd.DataFrame({
+            'name': self.name,
+            'team': self.team,
+            'position': self.position,
+            'proj_mean': self.proj_mean,
+            'proj_sd': self.proj_sd
+        })
+
+
+def load_player_pool(path, use_cache=True):
+    """
+    Read a CSV, JSON or Parquet player pool into a PlayerTable.
+
+    Only the columns in PLAYER_DTYPES are read, with explicit dtypes and positions
+    parsed as categories. The parsed table is cached as <path>.npz and reused while
+    the source file's size and modification time are unchanged.
+
+    Args:
+        path (str): Player pool file (.csv, .json or .parquet).
+        use_cache (bool): Read and write the .npz cache.
+
+    Returns:
+        PlayerTable: Columnar player pool.
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    signature = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    cache_path = f"{path}.npz"
+    if use_cache and os.path.exists(cache_path):
+        with np.load(cache_path) as data:
+            if np.array_equal(data['signature'], signature):
+                return PlayerTable(
+                    data['name'].astype(object),
+                    data['categories'].astype(object)[data['codes']],
+                    data['proj_mean'],
+                    data['proj_sd'],
+                    team=data['team'].astype(object)
+                )
+
+    df = _read_player_frame(path)
+    missing = [column for column in REQUIRED_COLUMNS if column not in df]
+    if missing:
+        raise ValueError(f"Player pool is missing columns: {', '.join(missing)}")
+    position = df['position'].astype('category')
+    categories = position.cat.categories.to_numpy(dtype=str)
+    codes = position.cat.codes.to_numpy()
+    team = df['team'].fillna("").to_numpy(dtype=str) if 'team' in df else np.full(len(df), "")
+    name = df['name'].to_numpy(dtype=str)
+    table = PlayerTable(
+        name.astype(object),
+        categories.astype(object)[codes],
+        df['proj_mean'].to_numpy(dtype=np.float64),
+        df['proj_sd'].to_numpy(dtype=np.float64),
+        team=team.astype(object)
+    )
+    if use_cache:
+        try:
+            with open(cache_path, 'wb') as f:
+                np.savez(f, signature=signature, name=name, team=team, codes=codes, categories=categories,
+                         proj_mean=table.proj_mean, proj_sd=table.proj_sd)
+        except OSError:
+            # Read-only source directories simply go uncached
+            pass
+    return table
+
+
+def _read_player_frame(path):
+    """
+    Read the player columns of a pool file.
+
+    Args:
+        path (str): Player pool file.
+
+    Returns:
+        pd.DataFrame: Columns from PLAYER_DTYPES that the file has.
+    """
+    import pandas as pd
+    if path.endswith(".csv"):
+        return pd.read_csv(path, usecols=lambda column: column in PLAYER_DTYPES, dtype=PLAYER_DTYPES)
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet player pools needs pyarrow: pip install rookiesophomore[parquet]") from None
+        present = [column for column in pq.read_schema(path).names if column in PLAYER_DTYPES]
+        df = pd.read_parquet(path, columns=present)
+    elif path.endswith(".json"):
+        with open(path, "r") as f:
+            records = json.load(f)
+        df = pd.DataFrame.from_records(records, columns=[c for c in PLAYER_DTYPES if any(c in r for r in records)])
+    else:
+        raise ValueError("Unsupported player pool file format. Use CSV, JSON or Parquet.")
+    return df.astype({column: dtype for column, dtype in PLAYER_DTYPES.items() if column in df})
+
+
+class RosterBatch:
+    """
+    A batch of equally sized rosters stored as an int32 index matrix into a PlayerTable.
+
+    Args:
+        players (PlayerTable): Player table the indices refer to.
+        index (array-like): (n_rosters, roster_size) player positions in the table.
+    """
+    def __init__(self, players, index):
+        self.players = players
+        index = np.asarray(index, dtype=np.int32)
+        if index.ndim == 1:
+            index = index[None, :]
+        self.index = np.ascontiguousarray(index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            key = slice(key, key + 1 if key != -1 else None)
+        return RosterBatch(self.players, self.index[key])
+
+    @property
+    def roster_size(self):
+        return self.index.shape[1]
+
+    @property
+    def means(self):
+        """(n_rosters, roster_size) weekly projected means."""
+        return self.players.proj_mean[self.index]
+
+    @property
+    def sds(self):
+        """(n_rosters, roster_size) weekly projected standard deviations."""
+        return self.players.proj_sd[self.index]
+
+    def names(self, i):
+        """
+        Player names for one roster.
+
+        Args:
+            i (int): Row of the batch.
+
+        Returns:
+            List[str]: Names of the rostered players.
+        """
+        return self.players.name[self.index[i]].tolist()
+
+    def chunks(self, size):
+        """
+        Split the batch into consecutive chunks.
+
+        Args:
+            size (int): Rosters per chunk.
+
+        Returns:
+            List[RosterBatch]: Chunks covering the batch in order.
+        """
+        return [self[i:i + size] for i in range(0, len(self), size)]
+
+    def to_frames(self):
+        """
+        Expand the batch into one DataFrame per roster.
+
+        Returns:
+            List[pd.DataFrame]: One DataFrame per roster.
+        """
+        df = self.players.to_frame()
+        return [df.iloc[row].reset_index(drop=True) for row in self.index]
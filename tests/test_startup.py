@@ -0,0 +1,50 @@
+"""
+Startup guards: importing the package and printing CLI help must stay fast and
+must not load numpy, pandas or matplotlib.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib")
+# Seconds per fresh interpreter, interpreter start included; the bench suite's
+# 0.2s budget with slack for slow or busy CI machines
+BUDGET = 0.5
+
+IMPORT_PACKAGE = "import rookiesophomore"
+CLI_HELP = """
+import runpy
+sys.argv = ["rookiesophomore", "--help"]
+try:
+    runpy.run_module("rookiesophomore.cli", run_name="__main__")
+except SystemExit:
+    pass
+"""
+REPORT_HEAVY = f"\nprint('heavy:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules), file=sys.stderr)"
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    return subprocess.run([sys.executable, "-c", "import sys\n" + code], env=env,
+                          capture_output=True, text=True, check=True)
+
+
+@pytest.mark.parametrize("code", [IMPORT_PACKAGE, CLI_HELP], ids=["import_package", "cli_help"])
+def test_startup_skips_heavy_modules(code):
+    report = [line for line in run_python(code + REPORT_HEAVY).stderr.splitlines() if line.startswith("heavy:")]
+    assert report == ["heavy:"]
+
+
+@pytest.mark.parametrize("code", [IMPORT_PACKAGE, CLI_HELP], ids=["import_package", "cli_help"])
+def test_startup_time(code):
+    run_python(code)  # warm the bytecode and filesystem caches
+    seconds = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        run_python(code)
+        seconds = min(seconds, time.perf_counter() - start)
+    assert seconds < BUDGET